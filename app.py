@@ -5,57 +5,144 @@ Voice-first AI tutor for IELTS speaking practice.
 Run with: streamlit run app.py
 """
 
+import importlib
+import threading
+
 import streamlit as st
 from dotenv import load_dotenv
 load_dotenv()
 import config
 from intelligence.vocabulary import VocabularySystem
-from intelligence.llm_engine import get_llm
-from intelligence.vocab_detector import VocabDetector
-from intelligence.ielts_scorer import IELTSScorer
 from engine.memory import ConversationMemory
 from engine.conversation_state import ConversationStateMachine
 from engine.buffer_manager import BufferManager
+from engine.resources import (
+    get_ielts_scorer,
+    get_shared_llm,
+    get_vocab_detector,
+    synth_word,
+    warm_pronunciations,
+)
+
+
+# ──────────────────────────────────────────────
+# Per-user resources
+# ──────────────────────────────────────────────
+# Stateful pipeline objects keyed by username, so they survive reruns and
+# reconnects instead of being rebuilt (and wiping in-flight state) each time.
+
+@st.cache_resource(show_spinner=False)
+def get_buffer_manager(username: str) -> BufferManager:
+    """Get the response buffer manager for a user."""
+    return BufferManager()
+
+
+@st.cache_resource(show_spinner=False)
+def get_memory(username: str, db_path: str) -> ConversationMemory:
+    """Get the conversation memory for a user."""
+    return ConversationMemory(db_path=db_path)
+
+
+@st.cache_resource(show_spinner=False)
+def get_state_machine(username: str) -> ConversationStateMachine:
+    """Get the conversation state machine for a user."""
+    return ConversationStateMachine()
+
+
+@st.cache_resource(show_spinner=False)
+def get_vocab_system(username: str, db_path: str) -> VocabularySystem:
+    """Get the vocabulary system (word bank loaded once) for a user."""
+    return VocabularySystem(db_path=db_path)
+
+
+def reset_user_resources(username: str):
+    """Reset a user's cached pipeline state (on logout — not on every rerun)."""
+    get_memory(username, str(config.get_db_path(username))).new_session()
+    get_state_machine(username).reset()
+    get_buffer_manager(username).clear()
+
+
+# ──────────────────────────────────────────────
+# Page routing
+# ──────────────────────────────────────────────
+# Sidebar label → (module, render function). Modules are imported lazily.
+_PAGES = {
+    "🎙️ Conversation": ("pages.conversation", "render_conversation_page"),
+    "📘 Word of the Day": ("pages.vocabulary", "render_vocabulary_page"),
+    "🎮 Games": ("pages.games", "render_games_page"),
+    "🧪 IELTS Practice": ("pages.ielts_practice", "render_ielts_practice_page"),
+    "📊 Progress": ("pages.progress", "render_progress_page"),
+    "📖 IELTS Guide": ("pages.guidance", "render_guidance_page"),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _load_page(module_name: str):
+    """Import a page module once per process."""
+    return importlib.import_module(module_name)
+
+
+@st.cache_resource(show_spinner=False)
+def _start_page_preload():
+    """Import the remaining page modules in the background (once per process)."""
+    def _preload():
+        for module_name, _ in _PAGES.values():
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                print(f"Warning: Failed to preload {module_name}: {e}")
+
+    threading.Thread(target=_preload, name="page-preload", daemon=True).start()
+    return True
 
 
 def init_session_state():
     """Initialize all session state variables on first load."""
-    if "initialized" not in st.session_state:
-        st.session_state.initialized = True
-        
-        username = st.session_state.get("username", "default")
-        db_path_str = str(config.get_db_path(username))
+    if "initialized" in st.session_state:
+        return
 
-        # Core systems
-        st.session_state.memory = ConversationMemory(db_path=db_path_str)
-        st.session_state.state_machine = ConversationStateMachine()
-        st.session_state.buffer_manager = BufferManager()
-        st.session_state.vocab_system = VocabularySystem(db_path=db_path_str)
+    username = st.session_state.get("username", "default")
+    db_path_str = str(config.get_db_path(username))
 
-        # LLM (lazy — initialized on first use)
-        st.session_state.llm = None
-        st.session_state.vocab_detector = VocabDetector()
-        st.session_state.ielts_scorer = IELTSScorer()
+    # Core systems (cached per user, so a rerun or re-login reuses them)
+    memory = get_memory(username, db_path_str)
+    vocab_system = get_vocab_system(username, db_path_str)
 
-        # Daily vocabulary
-        st.session_state.daily_words = st.session_state.vocab_system.get_daily_words()
-        st.session_state.memory.set_daily_vocab(
-            st.session_state.vocab_system.get_daily_word_names()
-        )
+    # Daily vocabulary
+    daily_words = vocab_system.get_daily_words()
+    threading.Thread(
+        target=warm_pronunciations,
+        args=([w["word"] for w in daily_words],),
+        daemon=True,
+    ).start()
+    memory.set_daily_vocab(vocab_system.get_daily_word_names())
 
+    # One bulk write instead of a proxy round-trip per key
+    st.session_state.update({
+        "memory": memory,
+        "state_machine": get_state_machine(username),
+        "buffer_manager": get_buffer_manager(username),
+        "vocab_system": vocab_system,
+        # LLM (lazy — initialized on first use)
+        "llm": None,
+        "vocab_detector": get_vocab_detector(),
+        "ielts_scorer": get_ielts_scorer(),
+        "daily_words": daily_words,
+        "sidebar_pronounced": set(),
         # Conversation UI state
-        st.session_state.conversation_history = []
-        st.session_state.current_status = "Ready to start"
-
+        "conversation_history": [],
+        "current_status": "Ready to start",
         # Audio state
-        st.session_state.audio_models_loaded = False
+        "audio_models_loaded": False,
+        "initialized": True,
+    })
 
 
 def get_llm_instance():
     """Get or create the LLM instance."""
     if st.session_state.llm is None:
         try:
-            st.session_state.llm = get_llm()
+            st.session_state.llm = get_shared_llm()
             st.session_state.vocab_detector.set_llm(st.session_state.llm)
             st.session_state.ielts_scorer.set_llm(st.session_state.llm)
             st.session_state.vocab_system.set_llm(st.session_state.llm)
@@ -161,6 +248,7 @@ def main():
     st.sidebar.markdown(f"# {config.APP_ICON} IELTS Coach")
     st.sidebar.markdown(f"**👤 User:** {st.session_state.username}")
     if st.sidebar.button("Logout", use_container_width=True):
+        reset_user_resources(st.session_state.username)
         for key in list(st.session_state.keys()):
             del st.session_state[key]
         st.rerun()
@@ -168,14 +256,7 @@ def main():
 
     page = st.sidebar.radio(
         "Navigate",
-        options=[
-            "🎙️ Conversation",
-            "📘 Word of the Day",
-            "🎮 Games",
-            "🧪 IELTS Practice",
-            "📊 Progress",
-            "📖 IELTS Guide",
-        ],
+        options=list(_PAGES),
         index=0,
     )
 
@@ -190,41 +271,18 @@ def main():
             )
         with speak_col:
             if st.button("🔊", key=f"sidebar_pronounce_{idx}", help=f"Hear '{word_data['word']}'"):
-                from audio.tts import TextToSpeech
-                if "tts" not in st.session_state:
-                    st.session_state.tts = TextToSpeech()
-                audio, mime = st.session_state.tts.synthesize_to_playable_bytes(
-                    f"{word_data['word']}. {word_data['word']}."
-                )
-                st.session_state[f"sidebar_audio_{idx}"] = audio
-                st.session_state[f"sidebar_mime_{idx}"] = mime
+                st.session_state.sidebar_pronounced.add(word_data["word"])
 
         st.sidebar.caption(word_data["meaning"])
-        if f"sidebar_audio_{idx}" in st.session_state and st.session_state[f"sidebar_audio_{idx}"]:
-            st.sidebar.audio(
-                st.session_state[f"sidebar_audio_{idx}"],
-                format=st.session_state.get(f"sidebar_mime_{idx}", "audio/mp3"),
-            )
+        if word_data["word"] in st.session_state.sidebar_pronounced:
+            audio, mime = synth_word(word_data["word"])
+            if audio:
+                st.sidebar.audio(audio, format=mime)
 
-    # Route to selected page
-    if page == "🎙️ Conversation":
-        from pages.conversation import render_conversation_page
-        render_conversation_page()
-    elif page == "📘 Word of the Day":
-        from pages.vocabulary import render_vocabulary_page
-        render_vocabulary_page()
-    elif page == "🎮 Games":
-        from pages.games import render_games_page
-        render_games_page()
-    elif page == "🧪 IELTS Practice":
-        from pages.ielts_practice import render_ielts_practice_page
-        render_ielts_practice_page()
-    elif page == "📊 Progress":
-        from pages.progress import render_progress_page
-        render_progress_page()
-    elif page == "📖 IELTS Guide":
-        from pages.guidance import render_guidance_page
-        render_guidance_page()
+    # Route to selected page, then warm the other pages off the UI thread
+    module_name, render_name = _PAGES[page]
+    getattr(_load_page(module_name), render_name)()
+    _start_page_preload()
 
 
 if __name__ == "__main__":
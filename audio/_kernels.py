@@ -0,0 +1,110 @@
+"""
+Numeric kernels for the real-time audio path.
+
+Compiled with Numba when it is installed (cache=True, so the JIT cost is
+paid once per install rather than once per process); otherwise equivalent
+NumPy implementations are used.
+"""
+
+import functools
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _to_mono_int16_numpy(src: np.ndarray, scale: float, out: np.ndarray):
+    """
+    Downmix a (channels, samples) frame to mono, scale, clip and cast to int16.
+
+    Args:
+        src: (channels, samples) array, int16 or float in [-1, 1]
+        scale: 32767 for float input, 1 for integer input
+        out: preallocated int16 array of length `samples`
+    """
+    mono = src.mean(axis=0)
+    np.multiply(mono, scale, out=mono)
+    np.clip(mono, -32768.0, 32767.0, out=mono)
+    np.copyto(out, mono, casting="unsafe")
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _to_mono_int16_numba(src, scale, out):
+        """Numba version of _to_mono_int16_numpy (single fused pass)."""
+        channels, n = src.shape
+        gain = scale / channels
+        for i in range(n):
+            acc = 0.0
+            for c in range(channels):
+                acc += src[c, i]
+            v = acc * gain
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            out[i] = np.int16(v)
+
+    to_mono_int16 = _to_mono_int16_numba
+else:
+    to_mono_int16 = _to_mono_int16_numpy
+
+
+def _int16_to_float32_numpy(src: np.ndarray, dst: np.ndarray, scale: float):
+    """
+    Scale int16 samples into a preallocated float32 array (1-D, same length).
+
+    Args:
+        src: int16 samples
+        dst: float32 output
+        scale: multiplier, e.g. 1/32768 to normalize to [-1, 1)
+    """
+    np.multiply(src, np.float32(scale), out=dst, casting="unsafe")
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _int16_to_float32_numba(src, dst, scale):
+        """Numba version of _int16_to_float32_numpy (auto-vectorized loop)."""
+        s = np.float32(scale)
+        for i in range(src.shape[0]):
+            dst[i] = src[i] * s
+
+    int16_to_float32 = _int16_to_float32_numba
+else:
+    int16_to_float32 = _int16_to_float32_numpy
+
+
+def warmup():
+    """Compile the kernels for the dtypes WebRTC delivers (float32 and int16)."""
+    out = np.zeros(480, dtype=np.int16)
+    to_mono_int16(np.zeros((2, 480), dtype=np.float32), 32767.0, out)
+    to_mono_int16(np.zeros((2, 480), dtype=np.int16), 1.0, out)
+    # Zero-copy frame views are read-only and (for packed stereo) strided
+    packed = np.frombuffer(bytes(2 * 480 * 2), dtype=np.int16).reshape(-1, 2).T
+    to_mono_int16(packed, 1.0, out)
+
+    # VAD input normalization
+    int16_to_float32(np.zeros(512, dtype=np.int16), np.zeros(512, dtype=np.float32), 1.0 / 32768.0)
+
+    # Load the pause detector's state machine kernels too
+    from audio.pause_detector import PauseDetector
+    PauseDetector().process_batch(np.zeros(1, dtype=np.bool_))
+
+
+@functools.cache
+def warmup_in_background() -> threading.Thread:
+    """Run warmup() on a daemon thread, once per process (later calls return that thread)."""
+    def _run():
+        try:
+            warmup()
+        except Exception as e:
+            print(f"Warning: Audio kernel warmup failed: {e}")
+
+    thread = threading.Thread(target=_run, name="audio-kernel-warmup", daemon=True)
+    thread.start()
+    return thread
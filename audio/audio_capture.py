@@ -6,10 +6,13 @@ feeds them through the VAD → Pause Detector pipeline, and
 accumulates audio for transcription.
 """
 
+import collections
+import functools
 import queue
 import threading
 import time
-from typing import Optional
+from math import gcd
+from typing import Callable, Optional
 
 import numpy as np
 
@@ -18,46 +21,175 @@ try:
 except ImportError:
     av = None
 
+try:
+    from scipy.signal import firwin, resample_poly
+except ImportError:
+    firwin = resample_poly = None
+
 import config
+from audio._kernels import to_mono_int16, warmup_in_background
 from audio.vad import VoiceActivityDetector
 from audio.pause_detector import PauseDetector, PauseState
 
+# Scale factor for float [-1, 1] → int16 conversion
+_INT16_SCALE = 32767
+
+# PyAV sample format name (packed or planar) → numpy dtype
+_SAMPLE_DTYPES = {
+    "s16": np.int16, "s16p": np.int16,
+    "s32": np.int32, "s32p": np.int32,
+    "flt": np.float32, "fltp": np.float32,
+    "dbl": np.float64, "dblp": np.float64,
+}
+
+
+def _frame_view(frame) -> np.ndarray:
+    """
+    View an av.AudioFrame's samples as a (channels, samples) array without copying.
+
+    Reads straight from the frame's first plane, so the view is only valid
+    while the frame is alive — consume it before returning from the callback.
+    Falls back to frame.to_ndarray() (a copy) for layouts a single plane
+    can't represent, i.e. planar multi-channel audio.
+    """
+    channels = len(frame.layout.channels)
+    dtype = _SAMPLE_DTYPES.get(frame.format.name)
+    if dtype is not None and (channels == 1 or not frame.format.is_planar):
+        try:
+            samples = np.frombuffer(frame.planes[0], dtype=dtype, count=frame.samples * channels)
+            # Packed formats interleave all channels in a single plane
+            return samples.reshape(-1, channels).T
+        except (ValueError, TypeError):
+            pass
+
+    audio_array = frame.to_ndarray()
+    if not frame.format.is_planar and channels > 1:
+        audio_array = audio_array.reshape(-1, channels).T
+    return audio_array
+
+
+def _resample_polyphase(audio: np.ndarray, up: int, down: int, taps: np.ndarray) -> np.ndarray:
+    """Polyphase resampling with a precomputed anti-aliasing filter."""
+    return resample_poly(audio, up, down, window=taps).astype(audio.dtype, copy=False)
+
+
+def _resample_decimate(audio: np.ndarray, down: int) -> np.ndarray:
+    """Integer decimation (e.g. 48k → 16k) — strided view, no copy."""
+    return audio[::down]
+
+
+@functools.lru_cache(maxsize=8)
+def _nearest_indices(n: int, up: int, down: int) -> np.ndarray:
+    """Source index for each output sample (frames are a fixed size, so this is reused)."""
+    return np.arange(0, n * up, down) // up
+
+
+def _resample_nearest(audio: np.ndarray, up: int, down: int) -> np.ndarray:
+    """Simple nearest-sample fallback."""
+    return audio[_nearest_indices(len(audio), up, down)]
+
+
+def _build_resampler(orig_sr: int, target_sr: int) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """
+    Build a resampler specialized for one source rate.
+
+    Returns None when no resampling is needed. The up/down ratio and
+    (with scipy) the FIR filter are computed here once per rate rather
+    than on every frame.
+    """
+    if orig_sr == target_sr:
+        return None
+
+    g = gcd(orig_sr, target_sr)
+    up, down = target_sr // g, orig_sr // g
+
+    if resample_poly is not None:
+        # Same Kaiser-windowed low-pass resample_poly designs by default
+        max_rate = max(up, down)
+        taps = firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+        return functools.partial(_resample_polyphase, up=up, down=down, taps=taps)
+
+    if up == 1:
+        return functools.partial(_resample_decimate, down=down)
+
+    return functools.partial(_resample_nearest, up=up, down=down)
+
+
+class ChunkPool:
+    """
+    Pool of reusable int16 chunk buffers.
+
+    Keeps the real-time WebRTC callback from allocating a fresh array
+    every time a short chunk has to be padded out to the VAD chunk size.
+    """
+
+    def __init__(self, chunk_size: int = config.AUDIO_CHUNK_SAMPLES, size: int = 4):
+        self.chunk_size = chunk_size
+        self._free: queue.LifoQueue = queue.LifoQueue()
+        for _ in range(size):
+            self._free.put(np.empty(chunk_size, dtype=np.int16))
+
+    def acquire(self) -> np.ndarray:
+        """Take a buffer from the pool (allocates one if the pool is empty)."""
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            return np.empty(self.chunk_size, dtype=np.int16)
+
+    def release(self, buf: np.ndarray):
+        """Return a buffer to the pool once the caller is done with it."""
+        self._free.put_nowait(buf)
+
 
 class AudioBuffer:
-    """Thread-safe buffer for accumulating audio frames during speech."""
+    """
+    Thread-safe buffer for accumulating audio frames during speech.
 
-    def __init__(self):
-        self._frames: list[np.ndarray] = []
+    Samples are written into a single preallocated int16 array with a write
+    cursor, so adding a frame is one memcpy and no per-frame allocation.
+    """
+
+    def __init__(self, capacity_samples: int = config.AUDIO_SAMPLE_RATE * config.AUDIO_MAX_TURN_SEC):
+        self._buf = np.empty(capacity_samples, dtype=np.int16)
+        self._write = 0
         self._lock = threading.Lock()
 
     def add_frame(self, frame: np.ndarray):
         """Add an audio frame to the buffer."""
+        n = len(frame)
         with self._lock:
-            self._frames.append(frame.copy())
+            end = self._write + n
+            if end > len(self._buf):
+                # Turn longer than expected — double capacity rather than drop audio
+                grown = np.empty(max(end, 2 * len(self._buf)), dtype=np.int16)
+                grown[:self._write] = self._buf[:self._write]
+                self._buf = grown
+            self._buf[self._write:end] = frame
+            self._write = end
+
+    def add_frames(self, frames: np.ndarray):
+        """Add a (n_frames, frame_size) block of audio frames to the buffer."""
+        self.add_frame(frames.reshape(-1))
 
     def get_audio(self) -> np.ndarray:
         """Get all accumulated audio as a single array."""
         with self._lock:
-            if not self._frames:
-                return np.array([], dtype=np.int16)
-            return np.concatenate(self._frames)
+            # Copy out — the backing array is reused after clear()
+            return self._buf[:self._write].copy()
 
     def clear(self):
         """Clear the buffer."""
         with self._lock:
-            self._frames.clear()
+            self._write = 0
 
     @property
     def duration_ms(self) -> float:
         """Approximate duration of buffered audio in milliseconds."""
-        with self._lock:
-            total_samples = sum(len(f) for f in self._frames)
-            return (total_samples / config.AUDIO_SAMPLE_RATE) * 1000
+        return (self._write / config.AUDIO_SAMPLE_RATE) * 1000
 
     @property
     def is_empty(self) -> bool:
-        with self._lock:
-            return len(self._frames) == 0
+        return self._write == 0
 
 
 class AudioCapture:
@@ -90,11 +222,23 @@ class AudioCapture:
         vad: Optional[VoiceActivityDetector] = None,
         pause_detector: Optional[PauseDetector] = None,
     ):
+        # Compile the frame-callback kernels off-thread before the first frame
+        if config.WARMUP_ENABLED:
+            warmup_in_background()
         self.vad = vad or VoiceActivityDetector()
         self.pause_detector = pause_detector or PauseDetector()
 
         self._audio_buffer = AudioBuffer()
-        self._completed_turns: queue.Queue = queue.Queue()
+        self._chunk_pool = ChunkPool()
+        self._int16_scratch = np.empty(0, dtype=np.int16)
+        # WebRTC fixes the sample rate at stream start, so the resampler is
+        # specialized once per rate and only rebuilt if the rate changes
+        self._resamplers: dict[int, Optional[Callable]] = {}
+        self._active_sample_rate: Optional[int] = None
+        self._active_resampler: Optional[Callable] = None
+        # Single producer (WebRTC thread) / single consumer (Streamlit thread):
+        # deque.append/popleft are atomic, so no lock is needed
+        self._completed_turns: collections.deque = collections.deque(maxlen=8)
         self._is_active = False
 
         # Status tracking for UI
@@ -116,89 +260,107 @@ class AudioCapture:
         if av is None:
             return frame
 
-        # Convert av.AudioFrame to numpy array
-        audio_array = frame.to_ndarray().flatten()
-
-        # Resample to 16kHz mono if needed
-        if frame.sample_rate != config.AUDIO_SAMPLE_RATE:
-            audio_array = self._resample(
-                audio_array, frame.sample_rate, config.AUDIO_SAMPLE_RATE
-            )
-
-        # Convert to int16 if float
-        if audio_array.dtype in (np.float32, np.float64):
-            audio_int16 = (audio_array * 32767).astype(np.int16)
-        else:
-            audio_int16 = audio_array.astype(np.int16)
-
-        # Process in chunks of AUDIO_CHUNK_SAMPLES
-        chunk_size = config.AUDIO_CHUNK_SAMPLES
-        for i in range(0, len(audio_int16), chunk_size):
-            chunk = audio_int16[i:i + chunk_size]
-            if len(chunk) < chunk_size:
-                # Pad short chunks with silence
-                chunk = np.pad(chunk, (0, chunk_size - len(chunk)))
-
-            self._process_chunk(chunk)
+        # View av.AudioFrame as a (channels, samples) array (zero-copy when possible)
+        audio_array = _frame_view(frame)
+
+        # Downmix to mono int16 in one pass into a reused scratch buffer —
+        # this is also where samples are copied out of av's frame memory
+        n = audio_array.shape[1]
+        if len(self._int16_scratch) < n:
+            self._int16_scratch = np.empty(n, dtype=np.int16)
+        audio_int16 = self._int16_scratch[:n]
+        scale = float(_INT16_SCALE) if audio_array.dtype.kind == "f" else 1.0
+        to_mono_int16(audio_array, scale, audio_int16)
+
+        # Resample to 16kHz if needed
+        if frame.sample_rate != self._active_sample_rate:
+            self._select_resampler(frame.sample_rate)
+        if self._active_resampler is not None:
+            audio_int16 = self._active_resampler(audio_int16)
+        n = len(audio_int16)
+
+        # Process in blocks of AUDIO_CHUNK_SAMPLES (full chunks are a view, no copy)
+        chunk_size = self._chunk_pool.chunk_size
+        n_full = n - n % chunk_size
+        if n_full:
+            self._process_chunks(audio_int16[:n_full].reshape(-1, chunk_size))
+
+        if n_full < n:
+            # Pad the short tail chunk with silence in a pooled buffer
+            tail = n - n_full
+            buf = self._chunk_pool.acquire()
+            try:
+                buf[:tail] = audio_int16[n_full:]
+                buf[tail:] = 0
+                self._process_chunks(buf.reshape(1, chunk_size))
+            finally:
+                self._chunk_pool.release(buf)
 
         return frame
 
-    def _process_chunk(self, chunk: np.ndarray):
-        """Process a single audio chunk through VAD → PauseDetector → Buffer."""
-        # Step 1: Voice Activity Detection
-        vad_result = self.vad.process_chunk(chunk)
-        self._last_vad_confidence = vad_result["confidence"]
-        is_speech = vad_result["is_speech"]
+    def _process_chunks(self, chunks: np.ndarray):
+        """
+        Process a (n_chunks, chunk_size) block through VAD → PauseDetector → Buffer.
 
-        # Step 2: Pause Detection State Machine
-        prev_state = self.pause_detector.state
-        new_state = self.pause_detector.process(is_speech)
-        self._current_state = new_state
+        VAD and the pause state machine each run once over the whole block;
+        if a turn completes part-way through, both are reset and the rest of
+        the block is processed from a clean state.
+        """
+        while len(chunks):
+            # Step 1: Voice Activity Detection
+            vad_result = self.vad.process_batch(chunks)
+
+            # Step 2: Pause Detection State Machine (stops at TURN_COMPLETE)
+            prev_state = self.pause_detector.state
+            states = self.pause_detector.process_batch(vad_result["is_speech"])
+            consumed = len(states)
+            new_state = PauseState(int(states[-1]))
+            self._last_vad_confidence = float(vad_result["confidence"][consumed - 1])
+            self._current_state = new_state
+
+            # Step 3: Buffer Management
+            prev_states = np.concatenate(([prev_state.value], states[:-1]))
+            if np.any((states == PauseState.SILENCE.value)
+                      & (prev_states == PauseState.SPEECH_STARTED.value)):
+                # False start (noise) — discard
+                self._audio_buffer.clear()
 
-        # Step 3: Buffer Management
-        if new_state in (PauseState.SPEAKING, PauseState.MAYBE_DONE):
             # Accumulate audio during speech (including the silence gap in MAYBE_DONE)
-            self._audio_buffer.add_frame(chunk)
+            speech_mask = (states == PauseState.SPEAKING.value) | (
+                states == PauseState.MAYBE_DONE.value
+            )
+            if speech_mask.any():
+                self._audio_buffer.add_frames(chunks[:consumed][speech_mask])
 
-        elif new_state == PauseState.TURN_COMPLETE:
-            # User finished speaking — save the buffered audio
-            if not self._audio_buffer.is_empty:
-                completed_audio = self._audio_buffer.get_audio()
-                self._completed_turns.put(completed_audio)
-                self._audio_buffer.clear()
+            if new_state == PauseState.TURN_COMPLETE:
+                # User finished speaking — save the buffered audio
+                if not self._audio_buffer.is_empty:
+                    completed_audio = self._audio_buffer.get_audio()
+                    self._completed_turns.append(completed_audio)
+                    self._audio_buffer.clear()
 
-            # Reset for next turn
-            self.pause_detector.reset()
-            self.vad.reset()
+                # Reset for next turn
+                self.pause_detector.reset()
+                self.vad.reset()
 
-        elif new_state == PauseState.SILENCE and prev_state == PauseState.SPEECH_STARTED:
-            # False start (noise) — discard
-            self._audio_buffer.clear()
+            chunks = chunks[consumed:]
 
-    def _resample(self, audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
-        """Resample audio to target sample rate."""
-        if orig_sr == target_sr:
-            return audio
-        try:
-            from scipy.signal import resample
-            num_samples = int(len(audio) * target_sr / orig_sr)
-            return resample(audio, num_samples)
-        except ImportError:
-            # Simple linear interpolation fallback
-            ratio = target_sr / orig_sr
-            indices = np.arange(0, len(audio), 1 / ratio)
-            indices = np.clip(indices.astype(int), 0, len(audio) - 1)
-            return audio[indices]
+    def _select_resampler(self, sample_rate: int):
+        """Switch to the resampler specialized for this source rate."""
+        if sample_rate not in self._resamplers:
+            self._resamplers[sample_rate] = _build_resampler(sample_rate, config.AUDIO_SAMPLE_RATE)
+        self._active_sample_rate = sample_rate
+        self._active_resampler = self._resamplers[sample_rate]
 
     def has_completed_turn(self) -> bool:
         """Check if there's a completed user turn ready for processing."""
-        return not self._completed_turns.empty()
+        return bool(self._completed_turns)
 
     def get_turn_audio(self) -> Optional[np.ndarray]:
         """Get the audio from the next completed turn (or None if none available)."""
         try:
-            return self._completed_turns.get_nowait()
-        except queue.Empty:
+            return self._completed_turns.popleft()
+        except IndexError:
             return None
 
     def get_status(self) -> dict:
@@ -207,7 +369,7 @@ class AudioCapture:
             "state": self._current_state.name,
             "vad_confidence": self._last_vad_confidence,
             "buffer_duration_ms": self._audio_buffer.duration_ms,
-            "pending_turns": self._completed_turns.qsize(),
+            "pending_turns": len(self._completed_turns),
             "pause_stats": self.pause_detector.get_stats(),
         }
 
@@ -216,9 +378,4 @@ class AudioCapture:
         self._audio_buffer.clear()
         self.pause_detector.reset()
         self.vad.reset()
-        # Drain completed turns queue
-        while not self._completed_turns.empty():
-            try:
-                self._completed_turns.get_nowait()
-            except queue.Empty:
-                break
+        self._completed_turns.clear()
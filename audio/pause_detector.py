@@ -10,10 +10,16 @@ State flow:
                                     └──────────┘  (speech resumes)
 """
 
-import time
 from enum import Enum, auto
 from typing import Optional, Callable
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 import config
 
 
@@ -26,6 +32,92 @@ class PauseState(Enum):
     TURN_COMPLETE = auto()    # User has finished speaking
 
 
+# Integer state codes used by the step kernel
+_SILENCE = PauseState.SILENCE.value
+_SPEECH_STARTED = PauseState.SPEECH_STARTED.value
+_SPEAKING = PauseState.SPEAKING.value
+_MAYBE_DONE = PauseState.MAYBE_DONE.value
+_TURN_COMPLETE = PauseState.TURN_COMPLETE.value
+
+_STATE_BY_CODE = {s.value: s for s in PauseState}
+
+
+def _step(state, is_speech, speech_chunks, silence_chunks, speaking_chunks,
+          min_speech_chunks, pause_threshold_chunks):
+    """
+    Advance the state machine by one chunk.
+
+    Pure integer arithmetic (no clocks, no callbacks) so it can be compiled
+    with Numba. Returns the updated (state, speech, silence, speaking) counters.
+    """
+    if state == _SILENCE:
+        if is_speech:
+            state = _SPEECH_STARTED
+            speech_chunks = 1
+            silence_chunks = 0
+
+    elif state == _SPEECH_STARTED:
+        if is_speech:
+            speech_chunks += 1
+            if speech_chunks >= min_speech_chunks:
+                # Enough continuous speech — confirmed real speech
+                state = _SPEAKING
+                speaking_chunks = 0
+        else:
+            # Speech stopped before reaching threshold — just noise
+            state = _SILENCE
+            speech_chunks = 0
+
+    elif state == _SPEAKING:
+        speaking_chunks += 1
+        if is_speech:
+            silence_chunks = 0
+        else:
+            silence_chunks = 1
+            state = _MAYBE_DONE
+
+    elif state == _MAYBE_DONE:
+        speaking_chunks += 1
+        if is_speech:
+            # Speech resumed — user was just pausing mid-sentence
+            state = _SPEAKING
+            silence_chunks = 0
+        else:
+            silence_chunks += 1
+            if silence_chunks >= pause_threshold_chunks:
+                # Enough silence — user is done speaking
+                state = _TURN_COMPLETE
+
+    # TURN_COMPLETE: stay until explicitly reset
+
+    return state, speech_chunks, silence_chunks, speaking_chunks
+
+
+def _run(is_speech, states_out, state, speech_chunks, silence_chunks, speaking_chunks,
+         min_speech_chunks, pause_threshold_chunks):
+    """Run _step over a block of VAD flags, stopping at TURN_COMPLETE."""
+    consumed = 0
+    for i in range(is_speech.shape[0]):
+        state, speech_chunks, silence_chunks, speaking_chunks = _step(
+            state, is_speech[i], speech_chunks, silence_chunks, speaking_chunks,
+            min_speech_chunks, pause_threshold_chunks,
+        )
+        states_out[i] = state
+        consumed = i + 1
+        if state == _TURN_COMPLETE:
+            break
+    return consumed, state, speech_chunks, silence_chunks, speaking_chunks
+
+
+# Plain njit functions over explicit int state rather than a numba jitclass:
+# calling a jitclass method from Python boxes/unboxes the instance on every
+# call, which measured ~3x slower per chunk than these kernels, and jitclasses
+# can't be cached to disk.
+if njit is not None:
+    _step = njit(cache=True)(_step)
+    _run = njit(cache=True)(_run)
+
+
 class PauseDetector:
     """
     Finite state machine for detecting end-of-turn pauses.
@@ -53,25 +145,23 @@ class PauseDetector:
         self.on_turn_complete = on_turn_complete
 
         # State
-        self._state = PauseState.SILENCE
+        self._state = _SILENCE
         self._speech_chunk_count = 0
         self._silence_chunk_count = 0
-        self._speech_start_time: Optional[float] = None
+        self._speaking_chunks = 0  # Chunks since speech was confirmed
 
     @property
     def state(self) -> PauseState:
-        return self._state
+        return _STATE_BY_CODE[self._state]
 
     @property
     def is_user_speaking(self) -> bool:
-        return self._state in (PauseState.SPEECH_STARTED, PauseState.SPEAKING)
+        return self._state in (_SPEECH_STARTED, _SPEAKING)
 
     @property
     def speech_duration_ms(self) -> float:
         """Duration of current speech segment in milliseconds."""
-        if self._speech_start_time is None:
-            return 0.0
-        return (time.time() - self._speech_start_time) * 1000
+        return float(self._speaking_chunks * self.chunk_ms)
 
     def process(self, is_speech: bool) -> PauseState:
         """
@@ -83,63 +173,73 @@ class PauseDetector:
         Returns:
             Current PauseState after processing
         """
-        if self._state == PauseState.SILENCE:
-            if is_speech:
-                self._state = PauseState.SPEECH_STARTED
-                self._speech_chunk_count = 1
-                self._silence_chunk_count = 0
-
-        elif self._state == PauseState.SPEECH_STARTED:
-            if is_speech:
-                self._speech_chunk_count += 1
-                if self._speech_chunk_count >= self.min_speech_chunks:
-                    # Enough continuous speech — confirmed real speech
-                    self._state = PauseState.SPEAKING
-                    self._speech_start_time = time.time()
-                    if self.on_speech_start:
-                        self.on_speech_start()
-            else:
-                # Speech stopped before reaching threshold — just noise
-                self._state = PauseState.SILENCE
-                self._speech_chunk_count = 0
-
-        elif self._state == PauseState.SPEAKING:
-            if is_speech:
-                self._silence_chunk_count = 0
-            else:
-                self._silence_chunk_count = 1
-                self._state = PauseState.MAYBE_DONE
-
-        elif self._state == PauseState.MAYBE_DONE:
-            if is_speech:
-                # Speech resumed — user was just pausing mid-sentence
-                self._state = PauseState.SPEAKING
-                self._silence_chunk_count = 0
-            else:
-                self._silence_chunk_count += 1
-                if self._silence_chunk_count >= self.pause_threshold_chunks:
-                    # Enough silence — user is done speaking
-                    self._state = PauseState.TURN_COMPLETE
-                    if self.on_turn_complete:
-                        self.on_turn_complete()
-
-        elif self._state == PauseState.TURN_COMPLETE:
-            # Stay in TURN_COMPLETE until explicitly reset
-            pass
-
-        return self._state
+        old_state = self._state
+        (
+            self._state,
+            self._speech_chunk_count,
+            self._silence_chunk_count,
+            self._speaking_chunks,
+        ) = _step(
+            self._state, is_speech,
+            self._speech_chunk_count, self._silence_chunk_count, self._speaking_chunks,
+            self.min_speech_chunks, self.pause_threshold_chunks,
+        )
+        self._fire_callbacks(old_state, self._state)
+        return _STATE_BY_CODE[self._state]
+
+    def process_batch(self, is_speech: np.ndarray) -> np.ndarray:
+        """
+        Feed a block of VAD results and return the state after each chunk.
+
+        Processing stops at TURN_COMPLETE (the caller handles the turn and
+        resets), so the result can be shorter than the input.
+
+        Args:
+            is_speech: bool array, one VAD result per chunk
+
+        Returns:
+            int8 array of PauseState values, one per consumed chunk
+        """
+        states = np.empty(len(is_speech), dtype=np.int8)
+        old_state = self._state
+        (
+            consumed,
+            self._state,
+            self._speech_chunk_count,
+            self._silence_chunk_count,
+            self._speaking_chunks,
+        ) = _run(
+            is_speech, states, self._state,
+            self._speech_chunk_count, self._silence_chunk_count, self._speaking_chunks,
+            self.min_speech_chunks, self.pause_threshold_chunks,
+        )
+        self._fire_callbacks(old_state, self._state)
+        return states[:consumed]
+
+    def _fire_callbacks(self, old_state: int, new_state: int):
+        """Invoke user callbacks for transitions made since old_state."""
+        # Speech is confirmed at most once per turn, and a turn can only
+        # complete after it — so comparing the endpoints is sufficient.
+        if (
+            self.on_speech_start
+            and old_state in (_SILENCE, _SPEECH_STARTED)
+            and new_state in (_SPEAKING, _MAYBE_DONE, _TURN_COMPLETE)
+        ):
+            self.on_speech_start()
+        if self.on_turn_complete and old_state != _TURN_COMPLETE and new_state == _TURN_COMPLETE:
+            self.on_turn_complete()
 
     def reset(self):
         """Reset to SILENCE state. Call after processing a completed turn."""
-        self._state = PauseState.SILENCE
+        self._state = _SILENCE
         self._speech_chunk_count = 0
         self._silence_chunk_count = 0
-        self._speech_start_time = None
+        self._speaking_chunks = 0
 
     def get_stats(self) -> dict:
         """Return current detector stats for debugging/UI."""
         return {
-            "state": self._state.name,
+            "state": self.state.name,
             "speech_chunks": self._speech_chunk_count,
             "silence_chunks": self._silence_chunk_count,
             "speech_duration_ms": self.speech_duration_ms,
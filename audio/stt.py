@@ -5,8 +5,12 @@ Transcribes accumulated audio when the pause detector signals TURN_COMPLETE.
 Optimized for non-native English speakers with VAD pre-filtering.
 """
 
+import functools
+import hashlib
 import io
 import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import Optional
 
 import numpy as np
@@ -14,30 +18,71 @@ import numpy as np
 import config
 
 
+@functools.lru_cache(maxsize=None)
+def get_whisper_model(model_size: str, device: str, compute_type: str):
+    """Load a Faster-Whisper model once per process (downloaded on first run)."""
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        num_workers=config.WHISPER_NUM_WORKERS,
+        cpu_threads=config.WHISPER_CPU_THREADS,
+    )
+
+
+def too_short_or_quiet(audio_data: np.ndarray, sample_rate: int = config.AUDIO_SAMPLE_RATE) -> bool:
+    """
+    Cheap pre-check: is this audio too short or too quiet to be worth transcribing?
+
+    Args:
+        audio_data: numpy array of audio samples (int16 or float32)
+        sample_rate: sample rate of the audio
+
+    Returns:
+        True if below STT_MIN_DURATION_SEC or STT_MIN_RMS
+    """
+    if len(audio_data) / sample_rate < config.STT_MIN_DURATION_SEC:
+        return True
+    # Squares straight into float32 — no separate normalized copy of int16 input
+    rms = float(np.sqrt(np.square(audio_data, dtype=np.float32).mean()))
+    if audio_data.dtype == np.int16:
+        rms /= 32768.0
+    return rms < config.STT_MIN_RMS
+
+
 class SpeechToText:
-    """Faster-Whisper transcription engine."""
+    """
+    Faster-Whisper transcription engine.
+
+    Safe to call from several threads at once: the model is created with
+    WHISPER_NUM_WORKERS CTranslate2 workers, which run concurrent
+    transcriptions in parallel. Only the small result cache is locked.
+    """
 
     def __init__(
         self,
         model_size: str = config.WHISPER_MODEL_SIZE,
         device: str = config.WHISPER_DEVICE,
         compute_type: str = config.WHISPER_COMPUTE_TYPE,
+        model=None,
     ):
-        self._model = None
-        self._lock = threading.Lock()
+        self._model = model
         self._model_size = model_size
         self._device = device
         self._compute_type = compute_type
-        self._load_model()
+        self._cache: OrderedDict[bytes, dict] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        if self._model is None:
+            self._load_model()
 
     def _load_model(self):
-        """Load Faster-Whisper model (downloaded on first run)."""
-        from faster_whisper import WhisperModel
-
-        self._model = WhisperModel(
+        """Fetch the shared Faster-Whisper model for this configuration."""
+        self._model = get_whisper_model(
             self._model_size,
-            device=self._device,
-            compute_type=self._compute_type,
+            self._device,
+            self._compute_type,
         )
 
     def transcribe(
@@ -57,62 +102,126 @@ class SpeechToText:
                 - text (str): Transcribed text
                 - language (str): Detected language
                 - confidence (float): Average transcription confidence
-                - segments (list): Individual segment details
+                - segments (dict): Per-segment details as parallel arrays —
+                  start, end, avg_logprob, no_speech_prob (float32 ndarrays)
+                  and text (list of str)
         """
-        with self._lock:
-            if isinstance(audio_data, str):
+        if isinstance(audio_data, str):
+            audio_float = audio_data
+            fingerprint = Path(audio_data).read_bytes()
+        else:
+            # Too short or too quiet to be speech — skip the model entirely
+            if too_short_or_quiet(audio_data, sample_rate):
+                return self._empty_result(len(audio_data) / sample_rate)
+
+            # Convert to float32 normalized to [-1, 1] if needed
+            if audio_data.dtype == np.int16:
+                audio_float = audio_data.astype(np.float32) / 32768.0
+            elif audio_data.dtype == np.float32:
                 audio_float = audio_data
             else:
-                # Convert to float32 normalized to [-1, 1] if needed
-                if audio_data.dtype == np.int16:
-                    audio_float = audio_data.astype(np.float32) / 32768.0
-                elif audio_data.dtype == np.float32:
-                    audio_float = audio_data
-                else:
-                    audio_float = audio_data.astype(np.float32)
-
-            # Transcribe with VAD filter
-            segments, info = self._model.transcribe(
-                audio_float,
-                language=config.WHISPER_LANGUAGE,
-                beam_size=config.WHISPER_BEAM_SIZE,
-                vad_filter=config.WHISPER_VAD_FILTER,
-                vad_parameters=dict(
-                    min_silence_duration_ms=500,
-                    speech_pad_ms=200,
-                ),
-            )
-
-            # Collect all segments
-            segment_list = []
-            full_text_parts = []
-            total_confidence = 0.0
-            segment_count = 0
-
-            for segment in segments:
-                segment_list.append({
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip(),
-                    "avg_logprob": segment.avg_logprob,
-                    "no_speech_prob": segment.no_speech_prob,
-                })
-                full_text_parts.append(segment.text.strip())
-                # Convert log probability to confidence
-                import math
-                total_confidence += math.exp(segment.avg_logprob)
-                segment_count += 1
-
-            full_text = " ".join(full_text_parts)
-            avg_confidence = (total_confidence / segment_count) if segment_count > 0 else 0.0
-
-            return {
-                "text": full_text,
-                "language": info.language,
-                "confidence": avg_confidence,
-                "segments": segment_list,
-                "duration_seconds": info.duration,
-            }
+                audio_float = audio_data.astype(np.float32)
+            fingerprint = audio_data.tobytes()
+
+        # Identical audio (e.g. a re-submitted recording) — reuse the result
+        key = hashlib.blake2b(fingerprint, digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return dict(cached)
+
+        # Array input has already been through Silero VAD + pause detection
+        # upstream, so Whisper's own VAD pass is only needed for raw files.
+        vad_filter = config.WHISPER_VAD_FILTER and isinstance(audio_data, str)
+
+        # Greedy decoding in latency mode, beam search otherwise
+        if config.WHISPER_LATENCY_MODE:
+            decode_options = dict(beam_size=1, best_of=1)
+        else:
+            decode_options = dict(beam_size=config.WHISPER_BEAM_SIZE)
+
+        # Transcribe — no lock: CTranslate2 workers handle concurrent calls
+        segments, info = self._model.transcribe(
+            audio_float,
+            language=config.WHISPER_LANGUAGE,
+            vad_filter=vad_filter,
+            vad_parameters=dict(
+                min_silence_duration_ms=500,
+                speech_pad_ms=200,
+            ),
+            **decode_options,
+        )
+
+        # Collect all segments as parallel arrays (one entry per segment)
+        starts = []
+        ends = []
+        avg_logprobs = []
+        no_speech_probs = []
+        texts = []
+
+        for segment in segments:
+            starts.append(segment.start)
+            ends.append(segment.end)
+            avg_logprobs.append(segment.avg_logprob)
+            no_speech_probs.append(segment.no_speech_prob)
+            texts.append(segment.text.strip())
+
+        segment_arrays = self._segment_arrays(starts, ends, avg_logprobs, no_speech_probs, texts)
+        full_text = " ".join(texts)
+        # Convert log probability to confidence
+        avg_confidence = float(np.exp(segment_arrays["avg_logprob"]).mean()) if texts else 0.0
+
+        result = {
+            "text": full_text,
+            "language": info.language,
+            "confidence": avg_confidence,
+            "segments": segment_arrays,
+            "duration_seconds": info.duration,
+        }
+
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > config.STT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return dict(result)
+
+    def warmup(self):
+        """
+        Run one dummy inference so the first real turn doesn't pay
+        CTranslate2's lazy initialization cost.
+        """
+        segments, _ = self._model.transcribe(
+            np.zeros(config.AUDIO_SAMPLE_RATE, dtype=np.float32),
+            language=config.WHISPER_LANGUAGE,
+            beam_size=1,
+            vad_filter=False,
+        )
+        # Segments are generated lazily — drain them to run the decoder
+        for _ in segments:
+            pass
+
+    def _empty_result(self, duration_seconds: float = 0.0) -> dict:
+        """Result returned when the audio is not worth transcribing."""
+        return {
+            "text": "",
+            "language": config.WHISPER_LANGUAGE,
+            "confidence": 0.0,
+            "segments": self._segment_arrays([], [], [], [], []),
+            "duration_seconds": duration_seconds,
+        }
+
+    @staticmethod
+    def _segment_arrays(starts, ends, avg_logprobs, no_speech_probs, texts) -> dict:
+        """Pack per-segment fields into float32 arrays so callers can aggregate with numpy."""
+        return {
+            "start": np.asarray(starts, dtype=np.float32),
+            "end": np.asarray(ends, dtype=np.float32),
+            "avg_logprob": np.asarray(avg_logprobs, dtype=np.float32),
+            "no_speech_prob": np.asarray(no_speech_probs, dtype=np.float32),
+            "text": texts,
+        }
 
     def transcribe_stream(self, audio_data: np.ndarray) -> str:
         """
@@ -5,15 +5,155 @@ Converts LLM text responses to natural-sounding speech audio.
 Runs locally on CPU with low latency.
 """
 
+import hashlib
 import io
+import queue
+import struct
 import subprocess
 import threading
-import wave
-from typing import Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, Optional
 
 import numpy as np
 
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+try:
+    import miniaudio
+except ImportError:
+    miniaudio = None
+
+try:
+    import piper
+    from piper.config import SynthesisConfig
+except ImportError:
+    piper = None
+    SynthesisConfig = None
+
+try:
+    from gtts import gTTS
+except ImportError:
+    gTTS = None
+
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
 import config
+from config import AUDIO_SAMPLE_RATE
+
+# One second of silence — the last-resort result when no TTS engine is available
+_SILENCE_1S = np.zeros(AUDIO_SAMPLE_RATE, dtype=np.int16)
+_SILENCE_1S.flags.writeable = False
+
+# RIFF/WAVE header layout for mono 16-bit PCM (44 bytes)
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+# Small pool of reusable BytesIO buffers for gTTS MP3 output
+_BYTESIO_POOL: queue.LifoQueue = queue.LifoQueue(maxsize=4)
+
+
+def _acquire_bytesio() -> io.BytesIO:
+    """Take an empty BytesIO from the pool (or a new one if the pool is empty)."""
+    try:
+        buf = _BYTESIO_POOL.get_nowait()
+    except queue.Empty:
+        return io.BytesIO()
+    buf.seek(0)
+    buf.truncate(0)
+    return buf
+
+
+def _release_bytesio(buf: io.BytesIO):
+    """Return a buffer to the pool; dropped if the pool is already full."""
+    try:
+        _BYTESIO_POOL.put_nowait(buf)
+    except queue.Full:
+        pass
+
+
+def _make_wav_bytes(pcm: bytes, sample_rate: int) -> bytes:
+    """Wrap mono 16-bit PCM bytes in a 44-byte WAV header."""
+    n = len(pcm)
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + n, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", n,
+    ) + pcm
+
+
+# The silence fallback as a ready-made WAV file
+_SILENCE_WAV = _make_wav_bytes(_SILENCE_1S.tobytes(), AUDIO_SAMPLE_RATE)
+
+
+class TTSCache:
+    """
+    Cache of synthesized audio bytes: an in-memory LRU in front of files
+    in TTS_CACHE_DIR, so repeated prompts skip synthesis across restarts.
+    """
+
+    def __init__(
+        self,
+        voice_id: str,
+        cache_dir: Path = config.TTS_CACHE_DIR,
+        max_entries: int = config.TTS_CACHE_MEMORY_ENTRIES,
+    ):
+        self._voice_id = voice_id
+        self._cache_dir = Path(cache_dir)
+        self._max_entries = max_entries
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, text: str, fmt: str) -> str:
+        return hashlib.blake2b(
+            f"{text}|{self._voice_id}|{fmt}".encode(), digest_size=16
+        ).hexdigest()
+
+    def get(self, text: str, fmt: str = "wav") -> Optional[bytes]:
+        """Return cached audio for text in the given format, or None."""
+        if len(text) > config.TTS_CACHE_MAX_TEXT_CHARS:
+            return None
+        key = self._key(text, fmt)
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+
+        try:
+            data = (self._cache_dir / f"{key}.{fmt}").read_bytes()
+        except OSError:
+            return None
+        self._remember(key, data)
+        return data
+
+    def put(self, text: str, data: bytes, fmt: str = "wav"):
+        """Store audio for text in memory and on disk."""
+        if len(text) > config.TTS_CACHE_MAX_TEXT_CHARS or not data:
+            return
+        key = self._key(text, fmt)
+        self._remember(key, data)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._cache_dir / f"{key}.{fmt}"
+            tmp_path = path.with_suffix(f".{fmt}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except OSError as e:
+            print(f"Warning: Failed to write TTS cache entry: {e}")
+
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            if len(self._memory) > self._max_entries:
+                self._memory.popitem(last=False)
 
 
 class TextToSpeech:
@@ -29,14 +169,28 @@ class TextToSpeech:
         self._speaker_id = speaker_id
         self._length_scale = length_scale
         self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._voice = None
+        self._syn_config = None
         self._piper_available = self._check_piper()
+        self._cache = TTSCache(f"{model_name}|{speaker_id}|{length_scale}")
+        if config.WARMUP_ENABLED and piper is not None:
+            # Load the voice and run one tiny synthesis off the calling thread
+            threading.Thread(target=self._warmup, name="tts-warmup", daemon=True).start()
+
+    def _warmup(self):
+        """Load Piper and run a dummy synthesis so the first real reply isn't cold."""
+        try:
+            for _ in self._piper_chunks("."):
+                pass
+        except Exception as e:
+            print(f"Warning: TTS warmup failed: {e}")
 
     def _check_piper(self) -> bool:
         """Check if piper-tts is available."""
-        try:
-            import piper
+        if piper is not None:
             return True
-        except ImportError:
+        else:
             # Fall back to command-line piper or gTTS
             try:
                 result = subprocess.run(
@@ -61,120 +215,295 @@ class TextToSpeech:
                 - sample_rate (int): Sample rate of the audio
                 - duration_seconds (float): Duration of the audio
         """
+        audio_data_list, sample_rate, _ = self._synthesize_chunks(text)
+
+        if len(audio_data_list) == 1:
+            audio_data = audio_data_list[0]
+        elif audio_data_list:
+            audio_data = np.concatenate(audio_data_list)
+        else:
+            audio_data = np.array([], dtype=np.int16)
+
+        return {
+            "audio_data": audio_data,
+            "sample_rate": sample_rate,
+            "duration_seconds": len(audio_data) / sample_rate,
+        }
+
+    def synthesize_stream(self, text: str) -> Iterator[tuple[np.ndarray, int]]:
+        """
+        Convert text to speech, yielding audio as soon as each piece is ready.
+
+        Piper synthesizes sentence by sentence, so playback of the first
+        sentence can start while the rest is still being generated. The
+        fallback engine yields the whole utterance as a single chunk.
+
+        Args:
+            text: Text to synthesize
+
+        Yields:
+            (audio_chunk, sample_rate) — int16 samples and their sample rate
+        """
         if not text or not text.strip():
-            return {
-                "audio_data": np.array([], dtype=np.int16),
-                "sample_rate": config.AUDIO_SAMPLE_RATE,
-                "duration_seconds": 0.0,
-            }
+            return
+
+        if self._piper_available:
+            started = False
+            try:
+                for item in self._piper_chunks(text):
+                    started = True
+                    yield item
+                return
+            except Exception as e:
+                print(f"Piper TTS error: {e}, falling back to alternative")
+                if started:
+                    # Played audio can't be taken back; callers that need the
+                    # whole utterance use _synthesize_chunks instead
+                    return
 
         with self._lock:
-            if self._piper_available:
-                return self._synthesize_piper(text)
-            else:
-                return self._synthesize_fallback(text)
+            result = self._synthesize_fallback(text)
+        yield result["audio_data"], result["sample_rate"]
 
-    def _synthesize_piper(self, text: str) -> dict:
-        """Synthesize using Piper TTS library."""
-        try:
-            import piper
-
-            # Use piper Python API
-            model_path = config.BASE_DIR / f"{self._model_name}.onnx"
-            voice = piper.PiperVoice.load(str(model_path))
-            from piper.config import SynthesisConfig
-
-            # Configure speech parameters
-            syn_config = SynthesisConfig(
-                speaker_id=self._speaker_id,
-                length_scale=self._length_scale,
-                noise_scale=config.PIPER_NOISE_SCALE,
-                noise_w_scale=config.PIPER_NOISE_W,
-            )
+    def _synthesize_chunks(self, text: str) -> tuple[list[np.ndarray], int, bool]:
+        """
+        Synthesize the whole text, falling back to the other engine on any Piper error.
 
-            # Generate audio chunks
-            chunks = voice.synthesize(text, syn_config=syn_config)
-            
-            # Combine chunks
-            audio_data_list = []
-            sample_rate = config.AUDIO_SAMPLE_RATE
-            for chunk in chunks:
-                sample_rate = chunk.sample_rate
-                audio_data_list.append(chunk.audio_int16_array)
-
-            if audio_data_list:
-                audio_data = np.concatenate(audio_data_list)
-            else:
-                audio_data = np.array([], dtype=np.int16)
+        Piper's chunks are buffered rather than handed out as they arrive, so a
+        failure part-way through re-synthesizes the full text instead of
+        returning only the first sentences.
 
-            duration = len(audio_data) / sample_rate
+        Returns:
+            (chunks, sample_rate, from_piper) — int16 sample arrays in playback
+            order; from_piper is True only if Piper synthesized the full text,
+            i.e. the audio belongs under this voice's cache key
+        """
+        if not text or not text.strip():
+            return [], AUDIO_SAMPLE_RATE, False
 
-            return {
-                "audio_data": audio_data,
-                "sample_rate": sample_rate,
-                "duration_seconds": duration,
-            }
+        if self._piper_available:
+            chunks = []
+            sample_rate = AUDIO_SAMPLE_RATE
+            try:
+                for audio_chunk, sample_rate in self._piper_chunks(text):
+                    chunks.append(audio_chunk)
+                return chunks, sample_rate, True
+            except Exception as e:
+                print(f"Piper TTS error: {e}, falling back to alternative")
 
+        with self._lock:
+            result = self._synthesize_fallback(text)
+        return [result["audio_data"]], result["sample_rate"], False
+
+    @staticmethod
+    def _session_options():
+        """ONNX Runtime options for Piper: all cores, full graph optimization."""
+        so = ort.SessionOptions()
+        so.intra_op_num_threads = config.PIPER_NUM_THREADS
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        return so
+
+    def _optimized_model_path(self, model_path: Path) -> Path:
+        """
+        Return an int8-quantized, graph-fused copy of the voice model.
+
+        Built once and cached next to the original as <model>.opt.onnx, with
+        a checksum of the source so it's only rebuilt when the voice changes.
+        Falls back to the original model if optimization fails.
+        """
+        opt_path = model_path.with_suffix(".opt.onnx")
+        checksum_path = opt_path.with_suffix(".onnx.blake2b")
+        try:
+            checksum = hashlib.blake2b(model_path.read_bytes(), digest_size=16).hexdigest()
+            if (
+                opt_path.exists()
+                and checksum_path.exists()
+                and checksum_path.read_text().strip() == checksum
+            ):
+                return opt_path
+
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            # Step 1: Dynamic int8 quantization of the MatMul weights
+            quant_path = model_path.with_suffix(".quant.onnx")
+            quantize_dynamic(
+                str(model_path),
+                str(quant_path),
+                weight_type=QuantType.QInt8,
+                op_types_to_quantize=["MatMul"],
+            )
+
+            # Step 2: Let ONNX Runtime fuse the graph and save the result
+            so = self._session_options()
+            so.optimized_model_filepath = str(opt_path)
+            ort.InferenceSession(str(quant_path), sess_options=so, providers=["CPUExecutionProvider"])
+            quant_path.unlink(missing_ok=True)
+
+            checksum_path.write_text(checksum)
+            return opt_path
         except Exception as e:
-            print(f"Piper TTS error: {e}, falling back to alternative")
-            return self._synthesize_fallback(text)
+            print(f"Warning: Piper model optimization failed, using original model: {e}")
+            return model_path
+
+    def _create_session(self, model_path: Path):
+        """Create Piper's InferenceSession on the configured device, falling back to CPU."""
+        cpu = ["CPUExecutionProvider"]
+        if config.PIPER_DEVICE == "cuda":
+            if "CUDAExecutionProvider" in ort.get_available_providers():
+                cuda_options = {"cudnn_conv_algo_search": "HEURISTIC"}
+                if config.PIPER_USE_CUDA_GRAPH:
+                    cuda_options["enable_cuda_graph"] = "1"
+                try:
+                    # The int8-quantized model's integer MatMuls only run on
+                    # CPU (forcing device copies), so CUDA uses the original
+                    session = ort.InferenceSession(
+                        str(model_path),
+                        sess_options=self._session_options(),
+                        providers=["CUDAExecutionProvider", *cpu],
+                        provider_options=[cuda_options, {}],
+                    )
+                    print(f"Piper TTS providers: {session.get_providers()}")
+                    return session
+                except Exception as e:
+                    print(f"Warning: Piper CUDA init failed, using CPU: {e}")
+            else:
+                print("Warning: CUDAExecutionProvider not available, Piper TTS using CPU")
+
+        session_path = model_path
+        if config.PIPER_OPTIMIZE_MODEL:
+            session_path = self._optimized_model_path(model_path)
+        return ort.InferenceSession(
+            str(session_path),
+            sess_options=self._session_options(),
+            providers=cpu,
+        )
+
+    def _get_voice(self):
+        """Load the Piper voice and synthesis config once, on first use."""
+        if self._voice is None:
+            with self._load_lock:
+                if self._voice is None:
+                    model_path = config.BASE_DIR / f"{self._model_name}.onnx"
+                    self._syn_config = SynthesisConfig(
+                        speaker_id=self._speaker_id,
+                        length_scale=self._length_scale,
+                        noise_scale=config.PIPER_NOISE_SCALE,
+                        noise_w_scale=config.PIPER_NOISE_W,
+                    )
+                    voice = piper.PiperVoice.load(str(model_path))
+                    if ort is not None and hasattr(voice, "session"):
+                        # PiperVoice.load uses default SessionOptions — rebuild
+                        # the session with our threading/optimization settings
+                        voice.session = self._create_session(model_path)
+                    self._voice = voice
+        return self._voice
+
+    def _piper_chunks(self, text: str) -> Iterator[tuple[np.ndarray, int]]:
+        """Yield Piper's per-sentence audio chunks (the lock is held only while generating)."""
+        voice = self._get_voice()
+        chunks = iter(voice.synthesize(text, syn_config=self._syn_config))
+        while True:
+            with self._lock:
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            yield chunk.audio_int16_array, chunk.sample_rate
 
     def _synthesize_fallback(self, text: str) -> dict:
         """
         Fallback TTS using gTTS (Google Text-to-Speech) for development.
         Not ideal for production but works without model downloads.
         """
-        try:
-            from gtts import gTTS
-            from pydub import AudioSegment
+        if gTTS is None or (miniaudio is None and AudioSegment is None):
+            # Ultimate fallback — return silence with a warning
+            print("WARNING: No TTS engine available. Install piper-tts or gTTS.")
+            return {
+                "audio_data": _SILENCE_1S,
+                "sample_rate": AUDIO_SAMPLE_RATE,
+                "duration_seconds": 1.0,
+            }
 
-            tts = gTTS(text=text, lang="en", slow=False)
-            mp3_buffer = io.BytesIO()
+        tts = gTTS(text=text, lang="en", slow=False)
+        mp3_buffer = _acquire_bytesio()
+        try:
             tts.write_to_fp(mp3_buffer)
+            audio_data = self._decode_mp3(mp3_buffer)
+        finally:
+            _release_bytesio(mp3_buffer)
+
+        duration = len(audio_data) / AUDIO_SAMPLE_RATE
+
+        return {
+            "audio_data": audio_data,
+            "sample_rate": AUDIO_SAMPLE_RATE,
+            "duration_seconds": duration,
+        }
+
+    @staticmethod
+    def _decode_mp3(mp3_buffer: io.BytesIO) -> np.ndarray:
+        """Decode MP3 bytes to mono int16 at AUDIO_SAMPLE_RATE."""
+        if miniaudio is not None:
+            # Decode + downmix + resample to 16kHz int16 in one in-process C pass
+            decoded = miniaudio.decode(
+                mp3_buffer.getvalue(),
+                output_format=miniaudio.SampleFormat.SIGNED16,
+                nchannels=1,
+                sample_rate=AUDIO_SAMPLE_RATE,
+            )
+            audio_data = np.frombuffer(decoded.samples, dtype=np.int16)
+        else:
+            # Convert MP3 to WAV (pydub shells out to ffmpeg)
             mp3_buffer.seek(0)
-
-            # Convert MP3 to WAV
             audio_segment = AudioSegment.from_mp3(mp3_buffer)
-            audio_segment = audio_segment.set_frame_rate(config.AUDIO_SAMPLE_RATE)
+            audio_segment = audio_segment.set_frame_rate(AUDIO_SAMPLE_RATE)
             audio_segment = audio_segment.set_channels(1)
-
             audio_data = np.array(audio_segment.get_array_of_samples(), dtype=np.int16)
-            duration = len(audio_data) / config.AUDIO_SAMPLE_RATE
-
-            return {
-                "audio_data": audio_data,
-                "sample_rate": config.AUDIO_SAMPLE_RATE,
-                "duration_seconds": duration,
-            }
-
-        except ImportError:
-            # Ultimate fallback — return silence with a warning
-            print("WARNING: No TTS engine available. Install piper-tts or gTTS.")
-            duration = 1.0
-            silence = np.zeros(int(config.AUDIO_SAMPLE_RATE * duration), dtype=np.int16)
-            return {
-                "audio_data": silence,
-                "sample_rate": config.AUDIO_SAMPLE_RATE,
-                "duration_seconds": duration,
-            }
+        return audio_data
 
     def synthesize_to_wav_bytes(self, text: str) -> bytes:
         """
         Synthesize text and return as WAV file bytes.
         Useful for Streamlit st.audio() playback.
         """
-        result = self.synthesize(text)
-        audio_data = result["audio_data"]
-        sample_rate = result["sample_rate"]
+        cached = self._cache.get(text, "wav")
+        if cached is not None:
+            return cached
+
+        # Header is fixed for mono 16-bit PCM, so pack it directly instead of
+        # going through the wave module
+        chunks, sample_rate, from_piper = self._synthesize_chunks(text)
+        if chunks and chunks[0] is _SILENCE_1S:
+            # No-engine placeholder — prebuilt, and never cached
+            return _SILENCE_WAV
+
+        pcm_parts = [audio_chunk.tobytes() for audio_chunk in chunks]
+        pcm = pcm_parts[0] if len(pcm_parts) == 1 else b"".join(pcm_parts)
+        wav_bytes = _make_wav_bytes(pcm, sample_rate)
+        # Fallback audio (e.g. after a transient Piper error) isn't this voice's
+        # output, so caching it would replay it under the Piper key across restarts
+        if from_piper:
+            self._cache.put(text, wav_bytes, "wav")
+        return wav_bytes
+
+    def synthesize_wav_stream(self, text: str) -> Iterator[bytes]:
+        """
+        Synthesize text as a sequence of standalone WAV files, one per chunk.
 
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+        Playback can start on the first sentence while the rest is still
+        being synthesized, and the full utterance is never held in memory.
+        Cached text is yielded as a single WAV.
+        """
+        cached = self._cache.get(text, "wav")
+        if cached is not None:
+            yield cached
+            return
 
-        return wav_buffer.getvalue()
+        for audio_chunk, sample_rate in self.synthesize_stream(text):
+            if audio_chunk is _SILENCE_1S:
+                yield _SILENCE_WAV
+                return
+            yield _make_wav_bytes(audio_chunk.tobytes(), sample_rate)
 
     def synthesize_to_mp3_bytes(self, text: str) -> Optional[bytes]:
         """
@@ -183,13 +512,16 @@ class TextToSpeech:
         since it skips the MP3→WAV conversion entirely.
         Returns None if gTTS is not available.
         """
+        if gTTS is None:
+            return None
         try:
-            from gtts import gTTS
-
             tts = gTTS(text=text, lang="en", slow=False)
-            mp3_buffer = io.BytesIO()
-            tts.write_to_fp(mp3_buffer)
-            return mp3_buffer.getvalue()
+            mp3_buffer = _acquire_bytesio()
+            try:
+                tts.write_to_fp(mp3_buffer)
+                return mp3_buffer.getvalue()
+            finally:
+                _release_bytesio(mp3_buffer)
         except Exception:
             return None
 
@@ -211,9 +543,13 @@ class TextToSpeech:
             return self.synthesize_to_wav_bytes(text), "audio/wav"
 
         # Try gTTS → direct MP3 (no pydub/ffmpeg needed)
-        mp3 = self.synthesize_to_mp3_bytes(text)
+        mp3 = self._cache.get(text, "mp3")
+        if mp3 is None:
+            mp3 = self.synthesize_to_mp3_bytes(text)
+            if mp3:
+                self._cache.put(text, mp3, "mp3")
         if mp3:
             return mp3, "audio/mp3"
 
         # Last resort: silence WAV
-        return self.synthesize_to_wav_bytes(text), "audio/wav"
+        return _SILENCE_WAV, "audio/wav"
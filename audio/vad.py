@@ -5,10 +5,36 @@ Processes 30ms audio chunks and returns speech/silence classification.
 Thread-safe for use in streamlit-webrtc callbacks.
 """
 
+import copy
+import functools
 import threading
 import numpy as np
 
+try:
+    import torch
+except ImportError:
+    torch = None
+
 import config
+from config import AUDIO_CHUNK_SAMPLES, AUDIO_SAMPLE_RATE
+from audio._kernels import int16_to_float32
+
+# int16 → [-1, 1) scale, as float32 so the multiply stays in one float32 loop
+_INV_32768 = np.float32(1.0 / 32768.0)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_silero(onnx: bool):
+    """Load Silero VAD via torch.hub once per process (downloaded on first run)."""
+    model, utils = torch.hub.load(
+        repo_or_dir="snakers4/silero-vad",
+        model="silero_vad",
+        force_reload=False,
+        onnx=onnx,
+    )
+    if not onnx:
+        model.eval()
+    return model, utils
 
 
 class VoiceActivityDetector:
@@ -19,19 +45,39 @@ class VoiceActivityDetector:
         self._model = None
         self._lock = threading.Lock()
         self._load_model()
+        if config.WARMUP_ENABLED:
+            # First inference initializes kernels/thread pools — pay it now
+            self.process_chunk(np.zeros(AUDIO_CHUNK_SAMPLES, dtype=np.int16))
+            self.reset()
 
     def _load_model(self):
-        """Load Silero VAD model via torch.hub (downloaded on first run)."""
-        import torch
-        self._model, self._utils = torch.hub.load(
-            repo_or_dir="snakers4/silero-vad",
-            model="silero_vad",
-            force_reload=False,
-            onnx=False,
-        )
-        self._model.eval()
+        """Get a Silero VAD model from the process-wide cache."""
+        model, self._utils = _load_silero(config.VAD_USE_ONNX)
+        # The model carries recurrent per-stream state (reset_states), so each
+        # detector needs its own copy
+        if config.VAD_USE_ONNX:
+            # The ONNX wrapper keeps its state in plain attributes next to a
+            # stateless, thread-safe InferenceSession (already single-threaded
+            # by Silero) — share the session, give this detector fresh state
+            self._model = copy.copy(model)
+            self._model.reset_states()
+        else:
+            self._model = copy.deepcopy(model)
         self._get_speech_timestamps = self._utils[0]
 
+        # Reusable input: a float32 scratch buffer and a tensor sharing its memory
+        self._scratch = np.empty(AUDIO_CHUNK_SAMPLES, dtype=np.float32)
+        self._tensor = torch.from_numpy(self._scratch)
+        # Same idea for blocks: one (rows, chunk) buffer plus a tensor view per row
+        self._ensure_block_rows(8)
+
+    def _ensure_block_rows(self, n_rows: int):
+        """Grow the block scratch buffer (and its per-row tensors) to n_rows."""
+        if hasattr(self, "_block") and len(self._block) >= n_rows:
+            return
+        self._block = np.empty((n_rows, AUDIO_CHUNK_SAMPLES), dtype=np.float32)
+        self._block_tensors = [torch.from_numpy(row) for row in self._block]
+
     def process_chunk(self, audio_chunk: np.ndarray) -> dict:
         """
         Process a single audio chunk and return VAD result.
@@ -45,26 +91,105 @@ class VoiceActivityDetector:
                 - is_speech (bool): True if speech detected
                 - confidence (float): Speech probability 0.0–1.0
         """
-        import torch
+        with self._lock:
+            speech_prob = self._speech_prob(audio_chunk)
+
+        return {
+            "is_speech": speech_prob >= self.threshold,
+            "confidence": speech_prob,
+        }
+
+    def process_batch(self, chunks: np.ndarray) -> dict:
+        """
+        Process a block of consecutive chunks in one call.
 
+        Args:
+            chunks: array of shape (n_chunks, config.AUDIO_CHUNK_SAMPLES)
+
+        Returns:
+            dict with keys:
+                - is_speech (np.ndarray[bool]): per-chunk speech flags
+                - confidence (np.ndarray[float32]): per-chunk speech probability
+        """
+        n = len(chunks)
+        confidence = np.empty(n, dtype=np.float32)
         with self._lock:
-            # Convert to float32 tensor normalized to [-1, 1]
-            if audio_chunk.dtype == np.int16:
-                audio_float = audio_chunk.astype(np.float32) / 32768.0
-            elif audio_chunk.dtype == np.float32:
-                audio_float = audio_chunk
+            if chunks.ndim != 2 or chunks.shape[1] != AUDIO_CHUNK_SAMPLES:
+                for i in range(n):
+                    confidence[i] = self._speech_prob(chunks[i])
             else:
-                audio_float = audio_chunk.astype(np.float32)
+                # Normalize the whole block in one ufunc call, then run the
+                # (stateful, sequential) model over the prebuilt row tensors
+                self._ensure_block_rows(n)
+                block = self._block[:n]
+                if chunks.dtype == np.int16 and chunks.flags.c_contiguous:
+                    int16_to_float32(chunks.reshape(-1), block.reshape(-1), _INV_32768)
+                elif chunks.dtype == np.int16:
+                    np.multiply(chunks, _INV_32768, out=block, casting="unsafe")
+                else:
+                    np.copyto(block, chunks, casting="unsafe")
+                model = self._model
+                sample_rate = AUDIO_SAMPLE_RATE
+                tensors = self._block_tensors
+                for i in range(n):
+                    confidence[i] = model(tensors[i], sample_rate).item()
+
+        return {
+            "is_speech": confidence >= self.threshold,
+            "confidence": confidence,
+        }
+
+    def process_frame(self, audio: np.ndarray) -> list[dict]:
+        """
+        Process a whole WebRTC frame by splitting it into chunk-sized windows.
+
+        Trailing samples that don't fill a full window are ignored — callers
+        that need them should carry them over into the next frame.
+
+        Args:
+            audio: 1-D array of samples (int16 or float32)
+
+        Returns:
+            One VAD result dict (is_speech, confidence) per window
+        """
+        chunk_size = AUDIO_CHUNK_SAMPLES
+        n = len(audio) // chunk_size
+        if n == 0:
+            return []
+        result = self.process_batch(audio[:n * chunk_size].reshape(n, chunk_size))
+        return [
+            {"is_speech": bool(is_speech), "confidence": float(confidence)}
+            for is_speech, confidence in zip(result["is_speech"], result["confidence"])
+        ]
+
+    def _speech_prob(self, audio_chunk: np.ndarray) -> float:
+        """Run the model on one chunk (caller holds the lock)."""
+        if len(audio_chunk) != len(self._scratch):
+            return self._speech_prob_alloc(audio_chunk)
+
+        # Normalize into the scratch buffer — self._tensor sees the new samples
+        if audio_chunk.dtype == np.int16:
+            int16_to_float32(audio_chunk, self._scratch, _INV_32768)
+        elif audio_chunk.dtype == np.float32:
+            np.copyto(self._scratch, audio_chunk)
+        else:
+            np.copyto(self._scratch, audio_chunk, casting="unsafe")
 
-            tensor = torch.from_numpy(audio_float)
+        # Get speech probability
+        return self._model(self._tensor, AUDIO_SAMPLE_RATE).item()
 
-            # Get speech probability
-            speech_prob = self._model(tensor, config.AUDIO_SAMPLE_RATE).item()
+    def _speech_prob_alloc(self, audio_chunk: np.ndarray) -> float:
+        """Slow path for chunks that don't match AUDIO_CHUNK_SAMPLES."""
+        # Convert to float32 tensor normalized to [-1, 1]
+        if audio_chunk.dtype == np.int16:
+            audio_float = np.multiply(audio_chunk, _INV_32768, dtype=np.float32)
+        elif audio_chunk.dtype == np.float32:
+            audio_float = audio_chunk
+        else:
+            audio_float = audio_chunk.astype(np.float32)
 
-            return {
-                "is_speech": speech_prob >= self.threshold,
-                "confidence": speech_prob,
-            }
+        tensor = torch.from_numpy(audio_float)
+        return self._model(tensor, AUDIO_SAMPLE_RATE).item()
 
     def reset(self):
         """Reset VAD internal state (call between utterances)."""
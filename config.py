@@ -5,6 +5,7 @@ All tunable parameters live here — no magic numbers elsewhere.
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # ──────────────────────────────────────────────
 # Paths
@@ -13,6 +14,7 @@ BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
 VOCAB_JSON_PATH = DATA_DIR / "ielts_vocabulary.json"
 TOPICS_JSON_PATH = DATA_DIR / "ielts_topics.json"
+GUIDANCE_JSON_PATH = DATA_DIR / "ielts_guidance.json"
 
 def get_db_path(username: str) -> Path:
     """Get the database path for a specific user."""
@@ -22,6 +24,19 @@ def get_db_path(username: str) -> Path:
         safe_username = "default"
     return DATA_DIR / f"{safe_username}_progress.db"
 
+# Applied once to each long-lived SQLite connection
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",            # Readers don't block the writer; one fsync per checkpoint
+    "synchronous=NORMAL",          # Safe under WAL; skips the fsync on every commit
+    "temp_store=MEMORY",
+    "cache_size=-20000",           # ~20MB page cache (negative = KiB)
+    "busy_timeout=5000",           # ms to wait on a locked database before failing
+)
+SQLITE_CACHED_STATEMENTS = 256    # Prepared-statement cache per connection (sqlite3 default is 128)
+SQLITE_WRITE_BATCH_MAX = 64       # Max queued turns flushed per write-behind transaction
+SQLITE_READ_CONNECTIONS = 2       # Read-only connections for status/progress queries (WAL: never block the writer)
+DAILY_PROGRESS_FLUSH_EVERY = 5     # Daily-progress updates accumulated in memory before one UPSERT
+
 # ──────────────────────────────────────────────
 # Audio Pipeline
 # ──────────────────────────────────────────────
@@ -31,6 +46,8 @@ AUDIO_CHUNK_MS = 32                # 32ms chunks for VAD (512 samples at 16kHz)
 # NOTE: Silero VAD v4+ requires chunk sizes of 512, 1024, or 1536 samples for 16kHz.
 # 480 samples (30ms) is too short and triggers "Input audio chunk is too short".
 AUDIO_CHUNK_SAMPLES = 512
+AUDIO_MAX_TURN_SEC = 120           # Preallocated capacity of the speech buffer (grows if exceeded)
+WARMUP_ENABLED = True              # Run a dummy inference at model load (STT/TTS/VAD) to avoid a cold first turn
 
 # ──────────────────────────────────────────────
 # Voice Activity Detection (Silero VAD)
@@ -38,6 +55,7 @@ AUDIO_CHUNK_SAMPLES = 512
 VAD_THRESHOLD = 0.5                # Speech probability threshold (0.0–1.0)
 VAD_MIN_SPEECH_MS = 300            # Minimum continuous speech to count as real speech
 VAD_MIN_SPEECH_CHUNKS = int(VAD_MIN_SPEECH_MS / AUDIO_CHUNK_MS)  # ~10 chunks
+VAD_USE_ONNX = True                # Run Silero on ONNX Runtime (faster per chunk than PyTorch on CPU)
 
 # ──────────────────────────────────────────────
 # Pause Detection
@@ -48,12 +66,22 @@ PAUSE_THRESHOLD_CHUNKS = int(PAUSE_THRESHOLD_MS / AUDIO_CHUNK_MS)  # ~67 chunks
 # ──────────────────────────────────────────────
 # Speech-to-Text (Faster-Whisper)
 # ──────────────────────────────────────────────
-WHISPER_MODEL_SIZE = "base"        # Options: tiny, base, small, medium, large-v3
+WHISPER_MODEL_SIZE = "base.en"     # Options: tiny(.en), base(.en), small(.en), medium(.en), large-v3
 WHISPER_DEVICE = "cpu"             # "cpu" or "cuda"
-WHISPER_COMPUTE_TYPE = "int8"      # int8 for CPU, float16 for GPU
+WHISPER_COMPUTE_TYPES = {          # Quantized compute type per device (int8 GEMM on CPU, INT8 tensor cores on GPU)
+    "cpu": "int8",
+    "cuda": "int8_float16",
+}
+WHISPER_COMPUTE_TYPE = WHISPER_COMPUTE_TYPES[WHISPER_DEVICE]
 WHISPER_LANGUAGE = "en"
 WHISPER_BEAM_SIZE = 5
-WHISPER_VAD_FILTER = True          # Enable built-in VAD filtering
+WHISPER_LATENCY_MODE = False       # Greedy decoding (beam_size=1, best_of=1) for lowest latency
+WHISPER_NUM_WORKERS = max(1, (os.cpu_count() or 2) // 2)  # Concurrent transcriptions (CTranslate2 workers)
+WHISPER_CPU_THREADS = 4            # Intra-op threads per worker
+WHISPER_VAD_FILTER = True          # Enable built-in VAD filtering (file input only — live audio is pre-filtered)
+STT_MIN_DURATION_SEC = 0.4         # Skip transcription for turns shorter than this
+STT_CACHE_SIZE = 32                # Recent transcriptions kept for identical retries
+STT_MIN_RMS = 0.005                # Skip transcription below this RMS level (normalized [-1, 1], ~-46 dBFS)
 
 # ──────────────────────────────────────────────
 # Text-to-Speech (Piper TTS)
@@ -63,6 +91,14 @@ PIPER_SPEAKER_ID = 0
 PIPER_LENGTH_SCALE = 1.0           # Speech speed (lower = faster)
 PIPER_NOISE_SCALE = 0.667          # Variation in speech
 PIPER_NOISE_W = 0.8                # Phoneme width noise
+PIPER_NUM_THREADS = os.cpu_count() or 1  # ONNX Runtime intra-op threads (its default is ~half the cores)
+PIPER_OPTIMIZE_MODEL = True        # Int8-quantize + fuse the voice once, cached as <model>.opt.onnx
+PIPER_DEVICE = os.getenv("PIPER_DEVICE", "cpu")  # "cpu" or "cuda" (needs onnxruntime-gpu)
+PIPER_USE_CUDA_GRAPH = False       # CUDA graphs need fixed input shapes — Piper's vary with text length
+TTS_CACHE_DIR = DATA_DIR / "tts_cache"  # Synthesized audio, keyed by text + voice params
+TTS_CACHE_MEMORY_ENTRIES = 256     # Recent syntheses also kept in memory
+TTS_CACHE_MAX_TEXT_CHARS = 500     # Longer texts are not cached (bounds disk growth)
+TTS_STREAMING = False              # TurnManager returns per-sentence WAV chunks (ai_audio_stream) instead of one WAV
 
 # ──────────────────────────────────────────────
 # LLM Configuration
@@ -79,12 +115,14 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "24h")  # Keep the model (and its prompt-prefix KV cache) loaded between sessions
 
 # ──────────────────────────────────────────────
 # Smart Response Buffering
 # ──────────────────────────────────────────────
 BUFFER_RELEVANCE_THRESHOLD = 0.6   # Drop buffered response if relevance < this
 BUFFER_MAX_AGE_MS = 10000          # Drop buffer if older than 10 seconds
+BUFFER_MAX_AGE_NS = BUFFER_MAX_AGE_MS * 1_000_000  # Same, for monotonic_ns timers
 BUFFER_MERGE_ENABLED = True        # Allow merging buffer with new context
 
 # ──────────────────────────────────────────────
@@ -97,7 +135,6 @@ AI_RESPONSE_DELAY_MS = 400          # Small pause before AI speaks (feels natura
 # Vocabulary System
 # ──────────────────────────────────────────────
 WORDS_PER_DAY = 3                  # Number of daily vocabulary words
-REINFORCEMENT_INTERVAL_TURNS = 5   # Reinforce vocab every N conversation turns
 VOCAB_MASTERY_THRESHOLD = 5        # Correct uses needed to consider word "mastered"
 
 # ──────────────────────────────────────────────
@@ -107,6 +144,7 @@ IELTS_SPEAKING_PART2_TIME_SEC = 120  # 2 minutes for Part 2
 IELTS_SPEAKING_PART2_PREP_SEC = 60   # 1 minute preparation
 IELTS_MIN_BAND = 1.0
 IELTS_MAX_BAND = 9.0
+SCORE_CACHE_DIR = DATA_DIR / "score_cache"  # Band-score results, keyed by transcript + duration + topic
 
 # ──────────────────────────────────────────────
 # UI
@@ -114,3 +152,10 @@ IELTS_MAX_BAND = 9.0
 APP_TITLE = "🎙️ IELTS English Speaking Coach"
 APP_ICON = "🎙️"
 SIDEBAR_DEFAULT_PAGE = "Conversation"
+
+# ──────────────────────────────────────────────
+# Read-only view
+# ──────────────────────────────────────────────
+# Immutable snapshot of every constant above, for code that passes settings
+# around or keys caches on them without risking accidental mutation.
+SETTINGS = MappingProxyType({k: v for k, v in globals().items() if k.isupper()})
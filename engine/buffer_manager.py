@@ -6,39 +6,51 @@ is still speaking, then deciding whether to continue, drop, or merge
 the buffered response based on relevance and freshness.
 """
 
+import itertools
 import time
-from enum import Enum, auto
+from collections import deque
+from enum import IntEnum
 from typing import Optional
 from dataclasses import dataclass, field
 
-import config
+from config import (
+    BUFFER_MAX_AGE_MS,
+    BUFFER_MAX_AGE_NS,
+    BUFFER_MERGE_ENABLED,
+    BUFFER_RELEVANCE_THRESHOLD,
+)
 
 
-class BufferAction(Enum):
+class BufferAction(IntEnum):
     """Actions the buffer manager can take."""
-    CONTINUE = auto()   # Use the buffered response as-is
-    MERGE = auto()      # Merge buffer with new user input context
-    DROP = auto()       # Discard buffer, generate fresh response
-    NONE = auto()       # No buffer exists
+    CONTINUE = 0   # Use the buffered response as-is
+    MERGE = 1      # Merge buffer with new user input context
+    DROP = 2       # Discard buffer, generate fresh response
+    NONE = 3       # No buffer exists
 
 
 @dataclass
 class BufferedResponse:
     """A response held in the buffer waiting for a decision."""
     text: str
-    created_at: float = field(default_factory=time.time)
+    created_at_ns: int = field(default_factory=time.monotonic_ns)  # Monotonic, not wall-clock
     context_summary: str = ""  # Summary of what the user said when this was generated
     relevance_score: Optional[float] = None
 
     @property
     def age_ms(self) -> float:
         """Age of the buffered response in milliseconds."""
-        return (time.time() - self.created_at) * 1000
+        return (time.monotonic_ns() - self.created_at_ns) / 1_000_000
+
+    _expired: bool = field(default=False, init=False, repr=False)
 
     @property
     def is_expired(self) -> bool:
         """Check if buffer has exceeded max age."""
-        return self.age_ms > config.BUFFER_MAX_AGE_MS
+        # Age only grows, so once expired the answer never changes — skip the clock read
+        if not self._expired:
+            self._expired = time.monotonic_ns() - self.created_at_ns > BUFFER_MAX_AGE_NS
+        return self._expired
 
 
 class BufferManager:
@@ -60,11 +72,12 @@ class BufferManager:
 
     def __init__(self):
         self._buffer: Optional[BufferedResponse] = None
-        self._decision_history: list[dict] = []
+        self._has_buffer = False  # Mirrors `self._buffer is not None` for cheap UI polling
+        self._decision_history: deque[dict] = deque(maxlen=50)  # Oldest entries drop off automatically
 
     @property
     def has_buffer(self) -> bool:
-        return self._buffer is not None
+        return self._has_buffer
 
     @property
     def current_buffer(self) -> Optional[BufferedResponse]:
@@ -82,6 +95,7 @@ class BufferManager:
             text=response_text,
             context_summary=context_summary,
         )
+        self._has_buffer = True
 
     def decide(
         self,
@@ -113,7 +127,7 @@ class BufferManager:
         # Decision tree
         if buffer.is_expired:
             action = BufferAction.DROP
-            reason = f"expired (age={buffer.age_ms:.0f}ms > {config.BUFFER_MAX_AGE_MS}ms)"
+            reason = f"expired (age={buffer.age_ms:.0f}ms > {BUFFER_MAX_AGE_MS}ms)"
 
         elif topic_changed:
             action = BufferAction.DROP
@@ -122,8 +136,8 @@ class BufferManager:
         elif relevance_score is not None:
             buffer.relevance_score = relevance_score
 
-            if relevance_score >= config.BUFFER_RELEVANCE_THRESHOLD:
-                if config.BUFFER_MERGE_ENABLED:
+            if relevance_score >= BUFFER_RELEVANCE_THRESHOLD:
+                if BUFFER_MERGE_ENABLED:
                     action = BufferAction.MERGE
                     reason = f"relevant ({relevance_score:.2f}) — merging with new context"
                 else:
@@ -131,7 +145,7 @@ class BufferManager:
                     reason = f"relevant ({relevance_score:.2f}) — using as-is"
             else:
                 action = BufferAction.DROP
-                reason = f"low relevance ({relevance_score:.2f} < {config.BUFFER_RELEVANCE_THRESHOLD})"
+                reason = f"low relevance ({relevance_score:.2f} < {BUFFER_RELEVANCE_THRESHOLD})"
         else:
             action = BufferAction.DROP
             reason = "no relevance score provided — dropping for safety"
@@ -146,23 +160,21 @@ class BufferManager:
             "timestamp": time.time(),
         })
 
-        # Keep history bounded
-        if len(self._decision_history) > 50:
-            self._decision_history = self._decision_history[-25:]
-
         # Clear the buffer
         result_buffer = self._buffer
         self._buffer = None
+        self._has_buffer = False
 
         return (action, result_buffer)
 
     def clear(self):
         """Clear the buffer without making a decision."""
         self._buffer = None
+        self._has_buffer = False
 
     def get_status(self) -> dict:
         """Get buffer status for UI display."""
-        if self._buffer is None:
+        if not self._has_buffer:
             return {"has_buffer": False}
         return {
             "has_buffer": True,
@@ -175,4 +187,5 @@ class BufferManager:
 
     def get_decision_history(self) -> list[dict]:
         """Get recent buffer decisions for debugging."""
-        return self._decision_history[-10:]
+        start = max(0, len(self._decision_history) - 10)
+        return list(itertools.islice(self._decision_history, start, None))
@@ -5,18 +5,19 @@ Master orchestrator for the entire conversation flow.
 Manages transitions between IDLE, LISTENING, PROCESSING, SPEAKING, and BUFFERING states.
 """
 
-from enum import Enum, auto
+from collections import deque
+from enum import IntEnum
 from typing import Optional
 import time
 
 
-class ConversationState(Enum):
+class ConversationState(IntEnum):
     """States of the conversation flow."""
-    IDLE = auto()          # App loaded, waiting for user to start
-    LISTENING = auto()     # Mic active, VAD running, collecting user speech
-    PROCESSING = auto()    # Transcribing + generating LLM response
-    SPEAKING = auto()      # Playing TTS audio
-    BUFFERING = auto()     # AI has response but user is still speaking — hold it
+    IDLE = 0          # App loaded, waiting for user to start
+    LISTENING = 1     # Mic active, VAD running, collecting user speech
+    PROCESSING = 2    # Transcribing + generating LLM response
+    SPEAKING = 3      # Playing TTS audio
+    BUFFERING = 4     # AI has response but user is still speaking — hold it
 
 
 # Valid state transitions
@@ -28,6 +29,20 @@ _VALID_TRANSITIONS = {
     ConversationState.BUFFERING: {ConversationState.PROCESSING, ConversationState.LISTENING},
 }
 
+# Same table as a bitmask per source state: bit `to` of _TRANSITION_MASK[from] is set if valid
+_TRANSITION_MASK = bytes(
+    sum(1 << target for target in _VALID_TRANSITIONS[state]) for state in ConversationState
+)
+
+# UI label per state, indexed by state value
+_STATE_LABELS = (
+    "Ready to start",
+    "🎙️ Listening...",
+    "🧠 Thinking...",
+    "🔊 Speaking...",
+    "⏸️ Waiting for you to finish...",
+)
+
 
 class ConversationStateMachine:
     """
@@ -44,8 +59,8 @@ class ConversationStateMachine:
 
     def __init__(self):
         self._state = ConversationState.IDLE
-        self._state_enter_time = time.time()
-        self._transition_history: list[dict] = []
+        self._state_enter_ns = time.monotonic_ns()
+        self._transition_history: deque[dict] = deque(maxlen=100)  # Bounded; oldest drop off
 
     @property
     def state(self) -> ConversationState:
@@ -54,7 +69,7 @@ class ConversationStateMachine:
     @property
     def state_duration_ms(self) -> float:
         """How long we've been in the current state (ms)."""
-        return (time.time() - self._state_enter_time) * 1000
+        return (time.monotonic_ns() - self._state_enter_ns) / 1_000_000
 
     def transition_to(self, new_state: ConversationState) -> bool:
         """
@@ -69,7 +84,7 @@ class ConversationStateMachine:
         Raises:
             ValueError: If the transition is not valid from the current state
         """
-        if new_state not in _VALID_TRANSITIONS.get(self._state, set()):
+        if not (_TRANSITION_MASK[self._state] >> new_state) & 1:
             raise ValueError(
                 f"Invalid transition: {self._state.name} → {new_state.name}. "
                 f"Valid targets: {[s.name for s in _VALID_TRANSITIONS.get(self._state, set())]}"
@@ -77,23 +92,19 @@ class ConversationStateMachine:
 
         old_state = self._state
         self._state = new_state
-        self._state_enter_time = time.time()
+        self._state_enter_ns = time.monotonic_ns()
 
         self._transition_history.append({
             "from": old_state.name,
             "to": new_state.name,
-            "timestamp": self._state_enter_time,
+            "timestamp": time.time(),  # Wall-clock, for display only
         })
 
-        # Keep history bounded
-        if len(self._transition_history) > 100:
-            self._transition_history = self._transition_history[-50:]
-
         return True
 
     def can_transition_to(self, target: ConversationState) -> bool:
         """Check if a transition to the target state is valid."""
-        return target in _VALID_TRANSITIONS.get(self._state, set())
+        return bool((_TRANSITION_MASK[self._state] >> target) & 1)
 
     # ── Convenience transition methods ──
 
@@ -124,21 +135,14 @@ class ConversationStateMachine:
     def reset(self):
         """Hard reset to IDLE state (bypasses transition validation)."""
         self._state = ConversationState.IDLE
-        self._state_enter_time = time.time()
+        self._state_enter_ns = time.monotonic_ns()
         self._transition_history.clear()
 
     def get_status(self) -> dict:
         """Get status for UI display."""
-        state_labels = {
-            ConversationState.IDLE: "Ready to start",
-            ConversationState.LISTENING: "🎙️ Listening...",
-            ConversationState.PROCESSING: "🧠 Thinking...",
-            ConversationState.SPEAKING: "🔊 Speaking...",
-            ConversationState.BUFFERING: "⏸️ Waiting for you to finish...",
-        }
         return {
             "state": self._state.name,
-            "label": state_labels.get(self._state, ""),
+            "label": _STATE_LABELS[self._state],
             "duration_ms": self.state_duration_ms,
             "transitions": len(self._transition_history),
         }
@@ -5,23 +5,67 @@ Maintains rolling context window, session state, and persistence
 for cross-session continuity.
 """
 
+import atexit
 import json
+import queue
 import sqlite3
+import threading
 import time
+from collections import deque
 from datetime import datetime, date
-from typing import Optional
+from typing import Callable, Optional
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import config
 
+# Hot-path statements, kept as constants so the connection's statement cache
+# always sees the identical string and reuses the prepared statement
+_SQL_INSERT_TURN = """INSERT INTO conversation_history
+    (session_id, role, content, timestamp, metadata)
+    VALUES (?, ?, ?, ?, ?)"""
+
+_SQL_UPSERT_SESSION = """INSERT OR REPLACE INTO session_summaries
+    (session_id, summary, turn_count, started_at, ended_at, rolling_summary)
+    VALUES (?, ?, ?, ?, ?, ?)"""
+
+_SQL_UPSERT_DAILY = """INSERT INTO daily_progress (date, total_speaking_time_sec, total_turns, games_played)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        total_speaking_time_sec = total_speaking_time_sec + ?,
+        total_turns = total_turns + ?,
+        games_played = games_played + ?"""
+
+_SQL_UPDATE_BAND = """UPDATE daily_progress SET estimated_band_score = ?
+    WHERE date = ?"""
+
+_SQL_SELECT_DAILY = """SELECT date, total_speaking_time_sec, total_turns,
+           words_practiced, estimated_band_score, games_played
+    FROM daily_progress
+    ORDER BY date DESC
+    LIMIT ?"""
+
+_EMPTY_JSON = "{}"  # Metadata for the common no-metadata turn, without json.dumps
+
+
+def _dumps_metadata(metadata: dict):
+    """Encode turn metadata — orjson bytes (stored as a BLOB) when available."""
+    if orjson is not None:
+        return orjson.dumps(metadata)
+    return json.dumps(metadata)
 
-@dataclass
+
+@dataclass(slots=True)
 class Turn:
     """A single conversation turn."""
     role: str          # "user" or "assistant"
     content: str
     timestamp: float = field(default_factory=time.time)
-    metadata: dict = field(default_factory=dict)
+    metadata: Optional[dict] = None  # None when there is none (the common case)
 
 
 class ConversationMemory:
@@ -30,6 +74,7 @@ class ConversationMemory:
 
     Features:
     - Rolling context window (last N turns) for LLM prompts
+    - Optional rolling summary of turns evicted from the window
     - Session state for current conversation
     - SQLite persistence for cross-session continuity
     - Vocabulary tracking integration
@@ -39,30 +84,100 @@ class ConversationMemory:
         self,
         max_turns: int = config.CONVERSATION_HISTORY_MAX_TURNS,
         db_path: Optional[str] = None,
+        summarizer: Optional[Callable[[str, list[Turn]], str]] = None,
     ):
+        """
+        Args:
+            max_turns: Size of the rolling context window
+            db_path: SQLite database path (defaults to the "default" user's)
+            summarizer: Optional (summary_so_far, evicted_turns) -> new_summary.
+                Called on a background thread for turns that fall out of the
+                window; the result is prepended to the context.
+        """
         self._max_turns = max_turns
-        self._turns: list[Turn] = []
-        self._session_id = f"session_{int(time.time())}"
+        self._turns: deque[Turn] = deque(maxlen=max_turns)  # Rolling window; evicts the oldest
+        # LLM-format {"role", "content"} dicts, kept in step with _turns
+        self._context_cache: deque[dict] = deque(maxlen=max_turns)
+        # Full prompt (vocab + summary prefixes + turns), rebuilt lazily after a change
+        self._prompt_messages: Optional[list[dict]] = None
+        # Index into _turns of the latest turn per role (-1 = none in window)
+        self._last_user_idx = -1
+        self._last_asst_idx = -1
+        # First few words of the latest user turns, for the session summary
+        self._recent_topics: deque[str] = deque(maxlen=5)
+        self._session_id = f"session_{time.time_ns()}"  # ns so a quick re-login can't reuse the id
+        self._started_iso: Optional[str] = None  # Time of the first turn, for save_session
         self._db_path = db_path if db_path else str(config.get_db_path("default"))
         self._vocab_words: list[str] = []  # Today's vocabulary words
+        self._vocab_system_msg: Optional[dict] = None  # Reminder prefix, rebuilt only when the words change
+
+        # Rolling summary of evicted turns
+        self._summarizer = summarizer
+        self._summary = ""
+        self._summary_msg: Optional[dict] = None
+        self._summary_generation = 0  # Bumped by clear() so stale results are dropped
+        self._summary_queue: queue.Queue = queue.Queue()
+        if summarizer is not None:
+            threading.Thread(target=self._summarizer_loop, daemon=True).start()
+
+        # One long-lived connection (autocommit) shared by all writes; the lock
+        # serializes access since TurnManager may call from a worker thread
+        self._lock = threading.Lock()
+        self._conn = self._connect()
 
         # Initialize database
         self._init_db()
 
-    def _init_db(self):
-        """Initialize SQLite database for persistence."""
+        # Daily-progress deltas not yet written (see update_daily_progress)
+        self._pending_daily = {"speaking_time_sec": 0.0, "turns": 0, "games": 0, "band": None}
+        self._pending_daily_date: Optional[str] = None
+        self._pending_daily_updates = 0
+
+        # Read-only pool for reporting queries; under WAL these run alongside
+        # the writer without taking self._lock
+        self._ro_conns: queue.Queue = queue.Queue()
+        for _ in range(config.SQLITE_READ_CONNECTIONS):
+            self._ro_conns.put(sqlite3.connect(
+                f"file:{self._db_path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=config.SQLITE_CACHED_STATEMENTS,
+            ))
+
+        # Write-behind: turns are queued and inserted by a background thread
+        # so commits stay off the turn loop
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        # The writer is a daemon thread, so queued turns and batched daily
+        # deltas would die with it on a normal interpreter exit
+        self._closed = False
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database connection and apply the configured PRAGMAs."""
         config.DATA_DIR.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self._db_path)
-        cursor = conn.cursor()
+        conn = sqlite3.connect(
+            self._db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=config.SQLITE_CACHED_STATEMENTS,
+        )
+        for pragma in config.SQLITE_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        return conn
 
-        cursor.executescript("""
+    def _init_db(self):
+        """Initialize SQLite database for persistence."""
+        # Runs in __init__ before the connection is shared — no lock needed
+        self._conn.executescript("""
             CREATE TABLE IF NOT EXISTS conversation_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 session_id TEXT NOT NULL,
                 role TEXT NOT NULL,
                 content TEXT NOT NULL,
                 timestamp REAL NOT NULL,
-                metadata TEXT DEFAULT '{}',
+                metadata TEXT DEFAULT '{}',  -- JSON; a UTF-8 BLOB when written via orjson
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             );
 
@@ -73,6 +188,7 @@ class ConversationMemory:
                 turn_count INTEGER DEFAULT 0,
                 started_at DATETIME NOT NULL,
                 ended_at DATETIME,
+                rolling_summary TEXT DEFAULT '',
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             );
 
@@ -105,8 +221,10 @@ class ConversationMemory:
             CREATE INDEX IF NOT EXISTS idx_daily_date ON daily_progress(date);
         """)
 
-        conn.commit()
-        conn.close()
+        # Databases created before rolling summaries lack the column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(session_summaries)")}
+        if "rolling_summary" not in columns:
+            self._conn.execute("ALTER TABLE session_summaries ADD COLUMN rolling_summary TEXT DEFAULT ''")
 
     def add_turn(self, role: str, content: str, metadata: Optional[dict] = None):
         """
@@ -120,38 +238,115 @@ class ConversationMemory:
         turn = Turn(
             role=role,
             content=content,
-            metadata=metadata or {},
+            metadata=metadata or None,
         )
+        if self._started_iso is None:
+            self._started_iso = datetime.fromtimestamp(turn.timestamp).isoformat()
+        if len(self._turns) == self._max_turns:
+            # The append evicts the oldest turn — fold it into the summary
+            if self._summarizer is not None:
+                self._summary_queue.put((self._summary_generation, self._turns[0]))
+            # A negative index means that role's latest turn was evicted,
+            # so none of its turns remain.
+            self._last_user_idx = max(self._last_user_idx - 1, -1)
+            self._last_asst_idx = max(self._last_asst_idx - 1, -1)
         self._turns.append(turn)
-
-        # Trim to max turns
-        if len(self._turns) > self._max_turns:
-            self._turns = self._turns[-self._max_turns:]
+        self._context_cache.append({"role": role, "content": content})
+        self._prompt_messages = None
+        if role == "user":
+            self._last_user_idx = len(self._turns) - 1
+            # Simple topic extraction — just use first few words (maxsplit
+            # stops scanning once they're found)
+            self._recent_topics.append(" ".join(content.split(None, 5)[:5]))
+        elif role == "assistant":
+            self._last_asst_idx = len(self._turns) - 1
 
         # Persist to database
         self._persist_turn(turn)
 
     def _persist_turn(self, turn: Turn):
-        """Save a turn to SQLite."""
+        """Queue a turn for the background writer."""
+        self._write_queue.put((
+            self._session_id,
+            turn.role,
+            turn.content,
+            turn.timestamp,
+            _dumps_metadata(turn.metadata) if turn.metadata else _EMPTY_JSON,
+        ))
+
+    def _writer_loop(self):
+        """Drain queued turns and insert each batch in one transaction."""
+        while True:
+            rows = [self._write_queue.get()]
+            # Step 1: Grab whatever else is already pending
+            while len(rows) < config.SQLITE_WRITE_BATCH_MAX:
+                try:
+                    rows.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Step 2: A None sentinel (from close) ends the thread after this batch
+            stop = None in rows
+            rows_to_write = [r for r in rows if r is not None]
+
+            # Step 3: Insert the batch
+            try:
+                if rows_to_write:
+                    with self._lock:
+                        self._conn.execute("BEGIN IMMEDIATE")
+                        try:
+                            self._conn.executemany(_SQL_INSERT_TURN, rows_to_write)
+                        except Exception:
+                            self._conn.execute("ROLLBACK")
+                            raise
+                        self._conn.execute("COMMIT")
+            except Exception as e:
+                print(f"Warning: Failed to persist {len(rows_to_write)} turn(s): {e}")
+            finally:
+                for _ in rows:
+                    self._write_queue.task_done()
+
+            if stop:
+                return
+
+    def _summarizer_loop(self):
+        """Fold evicted turns into the rolling summary, batching any backlog."""
+        while True:
+            pending = [self._summary_queue.get()]
+            while True:
+                try:
+                    pending.append(self._summary_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            generation = self._summary_generation
+            evicted = [turn for gen, turn in pending if gen == generation]
+            if not evicted:
+                continue
+
+            try:
+                summary = self._summarizer(self._summary, evicted)
+            except Exception as e:
+                print(f"Warning: Failed to update rolling summary: {e}")
+                continue
+
+            # Skip the result if clear() ran while the summarizer was working
+            if generation == self._summary_generation:
+                self._summary = summary
+                self._summary_msg = (
+                    {"role": "system", "content": f"[Prior context] {summary}"}
+                    if summary else None
+                )
+                self._prompt_messages = None
+
+    def flush(self):
+        """Block until every queued turn and daily-progress delta has been written."""
+        self._write_queue.join()
         try:
-            conn = sqlite3.connect(self._db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                """INSERT INTO conversation_history
-                   (session_id, role, content, timestamp, metadata)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (
-                    self._session_id,
-                    turn.role,
-                    turn.content,
-                    turn.timestamp,
-                    json.dumps(turn.metadata),
-                ),
-            )
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._flush_daily_locked()
         except Exception as e:
-            print(f"Warning: Failed to persist turn: {e}")
+            print(f"Warning: Failed to update daily progress: {e}")
 
     def get_context(self) -> list[dict]:
         """
@@ -161,34 +356,61 @@ class ConversationMemory:
             List of dicts with 'role' and 'content' keys,
             compatible with OpenAI chat format.
         """
-        return [
-            {"role": turn.role, "content": turn.content}
-            for turn in self._turns
-        ]
+        # Fresh list (callers may append to it); the dicts themselves are shared
+        summary_msg = self._summary_msg
+        if summary_msg is None:
+            return list(self._context_cache)
+        return [summary_msg, *self._context_cache]
 
     def get_context_with_vocab(self) -> list[dict]:
         """
-        Get conversation context with vocabulary reminders injected.
+        Get conversation context with the vocabulary reminder prepended.
 
-        Adds a system message about today's vocabulary words
-        every REINFORCEMENT_INTERVAL_TURNS turns.
+        The reminder is a system message at index 0 that only changes when
+        the daily words do, so the prompt prefix stays identical across
+        turns and LLM prefix caches keep hitting.
         """
-        context = self.get_context()
-
-        if self._vocab_words and len(self._turns) > 0:
-            turn_count = len(self._turns)
-            if turn_count % config.REINFORCEMENT_INTERVAL_TURNS == 0:
-                vocab_reminder = (
-                    f"[VOCABULARY REMINDER] Today's words: {', '.join(self._vocab_words)}. "
-                    f"Try to naturally weave these into the conversation."
-                )
-                context.append({"role": "system", "content": vocab_reminder})
+        return list(self.get_prompt_messages())
+
+    def get_shared_prefix(self) -> list[dict]:
+        """
+        Get the messages shared by every session today (the vocabulary reminder).
+
+        They lead the prompt so a local LLM's prefix KV cache can be reused
+        across sessions for the same day.
+        """
+        if self._vocab_system_msg is None:
+            return []
+        return [self._vocab_system_msg]
+
+    def get_session_suffix(self) -> list[dict]:
+        """Get the session-specific messages (rolling summary + turns)."""
+        return self.get_context()
+
+    def get_prompt_messages(self) -> list[dict]:
+        """
+        Get the full prompt context: shared prefix, then the session suffix.
 
-        return context
+        Returns the same list object until the next add_turn/set_daily_vocab/
+        clear, so callers must treat it as read-only (copy before appending).
+        """
+        messages = self._prompt_messages
+        if messages is None:
+            messages = self.get_shared_prefix() + self.get_session_suffix()
+            self._prompt_messages = messages
+        return messages
 
     def set_daily_vocab(self, words: list[str]):
         """Set today's vocabulary words for reinforcement."""
         self._vocab_words = words
+        self._vocab_system_msg = {
+            "role": "system",
+            "content": (
+                f"[VOCABULARY REMINDER] Today's words: {', '.join(words)}. "
+                f"Try to naturally weave these into the conversation."
+            ),
+        } if words else None
+        self._prompt_messages = None
 
     @property
     def turn_count(self) -> int:
@@ -197,87 +419,175 @@ class ConversationMemory:
     @property
     def last_user_text(self) -> str:
         """Get the last user turn text."""
-        for turn in reversed(self._turns):
-            if turn.role == "user":
-                return turn.content
-        return ""
+        if self._last_user_idx < 0:
+            return ""
+        return self._turns[self._last_user_idx].content
 
     @property
     def last_assistant_text(self) -> str:
         """Get the last assistant turn text."""
-        for turn in reversed(self._turns):
-            if turn.role == "assistant":
-                return turn.content
-        return ""
+        if self._last_asst_idx < 0:
+            return ""
+        return self._turns[self._last_asst_idx].content
 
     def get_session_summary(self) -> str:
         """Generate a summary of the current session for persistence."""
         if not self._turns:
             return "No conversation yet."
 
-        user_turns = [t for t in self._turns if t.role == "user"]
-        topics = set()
-        for turn in user_turns[-5:]:
-            # Simple topic extraction — just use first few words
-            words = turn.content.split()[:5]
-            topics.add(" ".join(words))
-
+        # De-duplicate, keeping each topic at its most recent position
+        topics = list(dict.fromkeys(reversed(self._recent_topics)))[::-1]
         return f"Session with {len(self._turns)} turns. Recent topics: {'; '.join(topics)}"
 
     def save_session(self):
         """Save session summary to database."""
+        self.flush()
         try:
-            conn = sqlite3.connect(self._db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                """INSERT OR REPLACE INTO session_summaries
-                   (session_id, summary, turn_count, started_at, ended_at)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (
-                    self._session_id,
-                    self.get_session_summary(),
-                    len(self._turns),
-                    datetime.fromtimestamp(self._turns[0].timestamp).isoformat()
-                    if self._turns else datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                ),
-            )
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._conn.execute(
+                    _SQL_UPSERT_SESSION,
+                    (
+                        self._session_id,
+                        self.get_session_summary(),
+                        len(self._turns),
+                        self._started_iso or datetime.now().isoformat(),
+                        datetime.now().isoformat(),
+                        self._summary,
+                    ),
+                )
         except Exception as e:
             print(f"Warning: Failed to save session: {e}")
 
     def update_daily_progress(self, speaking_time_sec: float = 0, band_score: float = None, games_played: int = 0, add_turn: bool = True):
-        """Update daily progress tracking."""
+        """
+        Update daily progress tracking.
+
+        Deltas are accumulated in memory and written as a single UPSERT every
+        DAILY_PROGRESS_FLUSH_EVERY calls, on a date change, and on flush()
+        (save_session, get_daily_progress, close — which also runs at interpreter exit).
+        """
         try:
             today = date.today().isoformat()
-            conn = sqlite3.connect(self._db_path)
-            cursor = conn.cursor()
-
-            turns_inc = 1 if add_turn else 0
-
-            cursor.execute(
-                """INSERT INTO daily_progress (date, total_speaking_time_sec, total_turns, games_played)
-                   VALUES (?, ?, ?, ?)
-                   ON CONFLICT(date) DO UPDATE SET
-                       total_speaking_time_sec = total_speaking_time_sec + ?,
-                       total_turns = total_turns + ?,
-                       games_played = games_played + ?""",
-                (today, speaking_time_sec, turns_inc, games_played, speaking_time_sec, turns_inc, games_played),
+
+            with self._lock:
+                # Don't mix two days' deltas in one row
+                if self._pending_daily_date not in (None, today):
+                    self._flush_daily_locked()
+
+                pending = self._pending_daily
+                pending["speaking_time_sec"] += speaking_time_sec
+                pending["turns"] += 1 if add_turn else 0
+                pending["games"] += games_played
+                if band_score is not None:
+                    pending["band"] = band_score
+                self._pending_daily_date = today
+                self._pending_daily_updates += 1
+
+                if self._pending_daily_updates >= config.DAILY_PROGRESS_FLUSH_EVERY:
+                    self._flush_daily_locked()
+        except Exception as e:
+            print(f"Warning: Failed to update daily progress: {e}")
+
+    def _flush_daily_locked(self):
+        """Write accumulated daily-progress deltas. Caller holds self._lock."""
+        day = self._pending_daily_date
+        if day is None:
+            return
+        pending = self._pending_daily
+        speaking_time_sec, turns, games = pending["speaking_time_sec"], pending["turns"], pending["games"]
+
+        # Autocommit connection — group both statements into one transaction
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute(
+                _SQL_UPSERT_DAILY,
+                (day, speaking_time_sec, turns, games, speaking_time_sec, turns, games),
             )
 
-            if band_score is not None:
-                cursor.execute(
-                    """UPDATE daily_progress SET estimated_band_score = ?
-                       WHERE date = ?""",
-                    (band_score, today),
+            if pending["band"] is not None:
+                self._conn.execute(
+                    _SQL_UPDATE_BAND,
+                    (pending["band"], day),
                 )
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
 
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"Warning: Failed to update daily progress: {e}")
+        self._pending_daily = {"speaking_time_sec": 0.0, "turns": 0, "games": 0, "band": None}
+        self._pending_daily_date = None
+        self._pending_daily_updates = 0
+
+    def get_daily_progress(self, limit: int = 30) -> list[dict]:
+        """
+        Get the most recent daily progress rows, newest first.
+
+        Args:
+            limit: Maximum number of days to return
+
+        Returns:
+            List of dicts, one per day
+        """
+        self.flush()
+        conn = self._ro_conns.get()
+        try:
+            rows = conn.execute(_SQL_SELECT_DAILY, (limit,)).fetchall()
+        finally:
+            self._ro_conns.put(conn)
+
+        return [
+            {
+                "date": row[0],
+                "total_speaking_time_sec": row[1] or 0,
+                "total_turns": row[2] or 0,
+                "words_practiced": row[3] or 0,
+                "estimated_band_score": row[4],
+                "games_played": row[5] or 0,
+            }
+            for row in rows
+        ]
 
     def clear(self):
         """Clear current session memory (doesn't affect database)."""
         self._turns.clear()
+        self._context_cache.clear()
+        self._prompt_messages = None
+        self._last_user_idx = -1
+        self._last_asst_idx = -1
+        self._recent_topics.clear()
+        self._started_iso = None
+        self._summary_generation += 1
+        self._summary = ""
+        self._summary_msg = None
+
+    def new_session(self):
+        """
+        End the current session and start a new one (e.g. on logout).
+
+        Saves the finished session's summary, then clears the rolling window
+        and switches to a fresh session id so later turns don't overwrite it.
+        """
+        if self._turns:
+            self.save_session()
+        else:
+            self.flush()
+        self.clear()
+        self._session_id = f"session_{time.time_ns()}"
+
+    def close(self):
+        """
+        Flush pending turns and close the database connection.
+
+        Registered with atexit in __init__; safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._write_queue.put(None)
+        self._writer.join()
+        self.flush()
+        while not self._ro_conns.empty():
+            self._ro_conns.get_nowait().close()
+        with self._lock:
+            self._conn.close()
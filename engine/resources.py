@@ -0,0 +1,67 @@
+"""
+Process-wide shared resources.
+
+Models are expensive to load and safe to share, so they are created once
+per server process instead of once per session/rerun.
+
+These factories live in an importable module rather than in app.py:
+`streamlit run app.py` executes the entry script as __main__, so a page's
+`from app import ...` loads a second copy of app whose st.cache_resource
+entries (keyed by __module__) are separate — and every model would be
+built twice.
+"""
+
+import streamlit as st
+
+import config
+from intelligence.llm_engine import get_llm
+from intelligence.vocab_detector import VocabDetector
+from intelligence.ielts_scorer import IELTSScorer
+
+
+@st.cache_resource(show_spinner="Loading speech recognition model...")
+def get_stt():
+    """Get the shared Faster-Whisper speech-to-text engine."""
+    from audio.stt import SpeechToText
+    stt = SpeechToText()
+    if config.WARMUP_ENABLED:
+        stt.warmup()
+    return stt
+
+
+@st.cache_resource(show_spinner=False)
+def get_tts():
+    """Get the shared text-to-speech engine."""
+    from audio.tts import TextToSpeech
+    return TextToSpeech()
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def synth_word(word: str) -> tuple[bytes, str]:
+    """Pronunciation audio for a vocabulary word, cached on disk across runs."""
+    return get_tts().synthesize_to_playable_bytes(f"{word}. {word}.")
+
+
+def warm_pronunciations(words: list[str]):
+    """Fill the pronunciation cache for today's words ahead of the first click."""
+    for word in words:
+        try:
+            synth_word(word)
+        except Exception as e:
+            print(f"Warning: Failed to pre-synthesize '{word}': {e}")
+
+
+@st.cache_resource(show_spinner=False)
+def get_shared_llm():
+    """Create the LLM provider once per process."""
+    return get_llm()
+
+
+@st.cache_resource(show_spinner=False)
+def get_vocab_detector() -> VocabDetector:
+    return VocabDetector()
+
+
+@st.cache_resource(show_spinner=False)
+def get_ielts_scorer() -> IELTSScorer:
+    return IELTSScorer()
@@ -5,15 +5,18 @@ Coordinates pause detection, conversation state, buffer management,
 and ensures the AI never interrupts the user.
 """
 
+import itertools
+import queue
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 
 import numpy as np
 
 import config
 from audio.audio_capture import AudioCapture
-from audio.stt import SpeechToText
+from audio.stt import SpeechToText, too_short_or_quiet
 from audio.tts import TextToSpeech
 from engine.conversation_state import ConversationStateMachine, ConversationState
 from engine.buffer_manager import BufferManager, BufferAction
@@ -67,6 +70,14 @@ class TurnManager:
         self._on_ai_response = on_ai_response
         self._on_state_change = on_state_change
 
+        # Runs a speculative fresh reply alongside relevance classification
+        self._llm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm")
+        # Synthesizes the reply while the natural pre-speech delay elapses
+        self._tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+
+        # State-change events, delivered to the UI thread by drain_events()
+        self._event_queue: queue.SimpleQueue = queue.SimpleQueue()
+
         # Internal state
         self._is_running = False
         self._last_user_text = ""
@@ -80,7 +91,9 @@ class TurnManager:
 
         Returns:
             dict with turn results if a turn was processed, None otherwise.
-            Keys: user_text, ai_response, ai_audio_bytes, buffer_action
+            Keys: user_text, ai_response, ai_audio_bytes, ai_audio_stream
+            (iterator of WAV chunks when TTS_STREAMING, else None),
+            buffer_action
         """
         # Check if there's a completed turn from audio capture
         if not self.capture.has_completed_turn():
@@ -90,6 +103,10 @@ class TurnManager:
         if audio_data is None or len(audio_data) == 0:
             return None
 
+        # Near-silence or a blip — drop it before leaving LISTENING or running STT
+        if too_short_or_quiet(audio_data):
+            return None
+
         # Transition to PROCESSING
         try:
             self.state.start_processing()
@@ -115,6 +132,7 @@ class TurnManager:
         # Step 2: Check buffer for pending AI response
         buffer_action = BufferAction.NONE
         ai_response_text = ""
+        fresh_future = None
 
         if self.buffer.has_buffer:
             # Compute relevance of buffered response to new input
@@ -122,6 +140,16 @@ class TurnManager:
             topic_changed = False
 
             if self._llm_classify_relevance:
+                # Speculatively generate a fresh reply during classification so
+                # DROP (the common outcome) doesn't wait on a second round trip.
+                # Context matches Step 3, where the user turn is added first.
+                if self._llm_generate:
+                    fresh_future = self._llm_executor.submit(
+                        self._llm_generate,
+                        user_text,
+                        [*self.memory.get_prompt_messages(), {"role": "user", "content": user_text}],
+                    )
+
                 relevance = self._llm_classify_relevance(
                     self.buffer.current_buffer.text,
                     user_text,
@@ -149,11 +177,17 @@ class TurnManager:
             # Add user turn to memory
             self.memory.add_turn("user", user_text)
 
-            # Generate response
-            ai_response_text = self._llm_generate(
-                user_text,
-                self.memory.get_context(),
-            )
+            # Generate response (or collect the speculative one)
+            if fresh_future is not None:
+                ai_response_text = fresh_future.result()
+            else:
+                ai_response_text = self._llm_generate(
+                    user_text,
+                    self.memory.get_prompt_messages(),
+                )
+        elif fresh_future is not None:
+            # Buffered response was used — discard the speculative reply
+            fresh_future.cancel()
 
         if ai_response_text:
             # Add AI turn to memory
@@ -162,13 +196,30 @@ class TurnManager:
             if self._on_ai_response:
                 self._on_ai_response(ai_response_text)
 
-        # Step 4: Natural delay before speaking (feels more human)
+        # Step 4: Start synthesizing speech in the background (when streaming,
+        # just the first chunk — the UI pulls the rest as it plays)
+        tts_future = None
+        wav_stream = None
+        if ai_response_text:
+            if config.TTS_STREAMING:
+                wav_stream = self.tts.synthesize_wav_stream(ai_response_text)
+                tts_future = self._tts_executor.submit(next, wav_stream, None)
+            else:
+                tts_future = self._tts_executor.submit(self.tts.synthesize_to_wav_bytes, ai_response_text)
+
+        # Step 5: Natural delay before speaking (feels more human) — overlaps synthesis
         time.sleep(config.AI_RESPONSE_DELAY_MS / 1000)
 
-        # Step 5: Synthesize speech
         ai_audio_bytes = None
-        if ai_response_text:
-            ai_audio_bytes = self.tts.synthesize_to_wav_bytes(ai_response_text)
+        ai_audio_stream = None
+        if tts_future is not None:
+            if wav_stream is not None:
+                first_chunk = tts_future.result()
+                ai_audio_stream = itertools.chain(
+                    () if first_chunk is None else (first_chunk,), wav_stream
+                )
+            else:
+                ai_audio_bytes = tts_future.result()
 
             # Transition to SPEAKING
             try:
@@ -184,6 +235,7 @@ class TurnManager:
             "user_text": user_text,
             "ai_response": ai_response_text,
             "ai_audio_bytes": ai_audio_bytes,
+            "ai_audio_stream": ai_audio_stream,
             "buffer_action": buffer_action.name,
             "transcription_confidence": transcription.get("confidence", 0.0),
         }
@@ -197,9 +249,31 @@ class TurnManager:
             pass
 
     def _notify_state_change(self):
-        """Notify UI of state change."""
+        """Queue a state-change event for the UI (never blocks the pipeline)."""
+        self._event_queue.put_nowait(("state", self.state.get_status()))
+
+    def drain_events(self) -> list[tuple[str, dict]]:
+        """
+        Collect all pending events. Call from the UI thread.
+
+        Runs the on_state_change callback (if any) for each state event here,
+        so its cost is paid by the UI rather than the STT/LLM/TTS path.
+
+        Returns:
+            List of (kind, payload) tuples, oldest first
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._event_queue.get_nowait())
+            except queue.Empty:
+                break
+
         if self._on_state_change:
-            self._on_state_change(self.state.get_status())
+            for kind, payload in events:
+                if kind == "state":
+                    self._on_state_change(payload)
+        return events
 
     def get_status(self) -> dict:
         """Get full turn manager status for UI/debugging."""
@@ -5,12 +5,60 @@ Evaluates speaking performance against official IELTS band descriptors
 using LLM analysis.
 """
 
+import hashlib
 import json
+import logging
+import re
+from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import config
 from intelligence.llm_engine import LLMProvider
 from intelligence import prompts
 
+logger = logging.getLogger(__name__)
+
+_EXAMINER_SYSTEM_PROMPT = "You are an IELTS speaking examiner. Respond with JSON only."
+
+# Outermost {...} / [...] span — models sometimes wrap the JSON in prose despite the prompt
+_JSON_BODY_RE = re.compile(r"\{.*\}", re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+# What a malformed LLM response can raise while parsing/clamping: JSON decode
+# errors and bad numbers (ValueError), null scores (TypeError), non-object
+# results (AttributeError)
+_MALFORMED_RESPONSE_ERRORS = (ValueError, TypeError, AttributeError)
+
+_CRITERIA_KEYS = ("fluency_coherence", "lexical_resource", "grammatical_range", "pronunciation")
+
+_EMPTY_RESULT = {
+    "fluency_coherence": {"score": 0, "feedback": "Not enough speech to evaluate"},
+    "lexical_resource": {"score": 0, "feedback": "Not enough speech to evaluate"},
+    "grammatical_range": {"score": 0, "feedback": "Not enough speech to evaluate"},
+    "pronunciation": {"score": 0, "feedback": "Cannot evaluate from text alone"},
+    "overall_band": 0,
+    "strengths": [],
+    "improvements": ["Try speaking more to get a proper evaluation"],
+}
+
+# Indexed by band - 1
+_BAND_DESCRIPTIONS = (
+    "Non-User — No ability to use language",
+    "Intermittent — Great difficulty understanding",
+    "Extremely Limited — Conveys only general meaning",
+    "Limited — Basic competence in familiar situations",
+    "Modest — Partial command, coping with overall meaning",
+    "Competent — Generally effective command despite some inaccuracies",
+    "Good — Operational command with occasional inaccuracies",
+    "Very Good — Fully operational with occasional inaccuracies",
+    "Expert — Full operational command of English",
+)
+
 
 class IELTSScorer:
     """
@@ -23,10 +71,19 @@ class IELTSScorer:
     4. Pronunciation (estimated from transcription)
 
     Returns per-criterion scores, overall band, and actionable feedback.
+    Results are cached on disk (SCORE_CACHE_DIR), so re-scoring the same
+    transcript skips the LLM round trip; pass cache_dir=None to disable.
     """
 
-    def __init__(self, llm: Optional[LLMProvider] = None):
+    __slots__ = ("_llm", "_cache_dir")
+
+    def __init__(
+        self,
+        llm: Optional[LLMProvider] = None,
+        cache_dir: Optional[Path] = config.SCORE_CACHE_DIR,
+    ):
         self._llm = llm
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def set_llm(self, llm: LLMProvider):
         """Set the LLM provider."""
@@ -52,6 +109,11 @@ class IELTSScorer:
         if not self._llm or not student_text.strip():
             return self._empty_result()
 
+        cache_key = self._cache_key(student_text, duration_seconds, topic)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         prompt = prompts.SYSTEM_BAND_SCORE.format(
             student_text=student_text,
             duration_seconds=f"{duration_seconds:.1f}",
@@ -62,57 +124,165 @@ class IELTSScorer:
             response = self._llm.generate(
                 user_message=prompt,
                 context=[],
-                system_prompt="You are an IELTS speaking examiner. Respond with JSON only.",
+                system_prompt=_EXAMINER_SYSTEM_PROMPT,
                 temperature=0.2,
                 max_tokens=500,
             )
+        except Exception as e:
+            # Provider errors have no common base class across backends
+            logger.warning("IELTS scoring request failed: %s", e)
+            return self._empty_result()
 
-            response_text = response.strip()
-            if response_text.startswith("```"):
-                response_text = response_text.split("\n", 1)[1].rsplit("```", 1)[0]
+        try:
+            result = self._clamp_scores(self._parse_json(response, _JSON_BODY_RE))
+        except _MALFORMED_RESPONSE_ERRORS as e:
+            logger.warning("IELTS scoring failed: %s", e)
+            return self._empty_result()
 
-            result = json.loads(response_text)
+        self._cache_put(cache_key, result)
+        return result
 
-            # Validate and clamp scores
-            for key in ["fluency_coherence", "lexical_resource",
-                        "grammatical_range", "pronunciation"]:
-                if key in result:
-                    score = result[key].get("score", 5.0)
-                    result[key]["score"] = max(1.0, min(9.0, float(score)))
+    def evaluate_batch(self, items: list[tuple[str, float, str]]) -> list[dict]:
+        """
+        Evaluate several speaking samples with a single LLM request.
 
-            if "overall_band" in result:
-                result["overall_band"] = max(1.0, min(9.0, float(result["overall_band"])))
+        Falls back to one evaluate() call per sample if the batched response
+        can't be parsed or doesn't contain one result per sample.
 
-            return result
+        Args:
+            items: (student_text, duration_seconds, topic) per sample
 
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"Warning: IELTS scoring failed: {e}")
-            return self._empty_result()
+        Returns:
+            One evaluate()-style result dict per item, in input order
+        """
+        results = [self._empty_result()] * len(items)
+        if not self._llm:
+            return results
+
+        # Blank and already-scored samples don't take a slot in the prompt
+        cache_keys = [self._cache_key(*item) for item in items]
+        pending = []
+        for i, (student_text, _, _) in enumerate(items):
+            if not student_text.strip():
+                continue
+            cached = self._cache_get(cache_keys[i])
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+        if not pending:
+            return results
+
+        transcripts = "\n\n".join(
+            prompts.BAND_SCORE_BATCH_ITEM.format(
+                index=n,
+                student_text=items[i][0],
+                duration_seconds=f"{items[i][1]:.1f}",
+                topic=items[i][2],
+            )
+            for n, i in enumerate(pending, 1)
+        )
+        prompt = prompts.SYSTEM_BAND_SCORE_BATCH.format(count=len(pending), transcripts=transcripts)
+
+        try:
+            response = self._llm.generate(
+                user_message=prompt,
+                context=[],
+                system_prompt=_EXAMINER_SYSTEM_PROMPT,
+                temperature=0.2,
+                max_tokens=500 * len(pending),
+            )
+        except Exception as e:
+            logger.warning("Batched IELTS scoring request failed: %s", e)
+            return results
+
+        try:
+            scored = self._parse_json(response, _JSON_ARRAY_RE)
+            if not isinstance(scored, list) or len(scored) != len(pending):
+                raise ValueError(f"expected {len(pending)} results")
+            scored = [self._clamp_scores(result) for result in scored]
+        except _MALFORMED_RESPONSE_ERRORS as e:
+            logger.warning("Batched IELTS scoring failed (%s), scoring samples one by one", e)
+            return [self.evaluate(*item) for item in items]
+
+        for i, result in zip(pending, scored):
+            results[i] = result
+            self._cache_put(cache_keys[i], result)
+        return results
+
+    @staticmethod
+    def _cache_key(student_text: str, duration_seconds: float, topic: str) -> str:
+        # Duration at the precision the prompt shows it, so equal prompts share a key
+        return hashlib.blake2b(
+            f"{topic}\x00{duration_seconds:.1f}\x00{student_text}".encode(), digest_size=16
+        ).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[dict]:
+        """Return the cached result for key, or None."""
+        if self._cache_dir is None:
+            return None
+        try:
+            data = (self._cache_dir / f"{key}.json").read_bytes()
+        except OSError:
+            return None
+        try:
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except ValueError:
+            return None
+
+    def _cache_put(self, key: str, result: dict):
+        """Store a scored result on disk."""
+        if self._cache_dir is None:
+            return
+        try:
+            data = orjson.dumps(result) if orjson is not None else json.dumps(result).encode()
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._cache_dir / f"{key}.json"
+            tmp_path = path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except (OSError, TypeError) as e:
+            logger.warning("Failed to write score cache entry: %s", e)
+
+    @staticmethod
+    def _parse_json(response: str, body_re: re.Pattern):
+        """Strip code fences and surrounding prose from an LLM response, then parse it."""
+        response_text = response.strip()
+        if response_text.startswith("```"):
+            # Drop the opening fence line (and its ```json tag) and the closing fence
+            start = response_text.find("\n") + 1
+            end = response_text.rfind("```")
+            response_text = response_text[start:end] if end > start else response_text[start:]
+
+        match = body_re.search(response_text)
+        if match:
+            response_text = match.group(0)
+
+        if orjson is not None:
+            return orjson.loads(response_text)
+        return json.loads(response_text)
+
+    @staticmethod
+    def _clamp_scores(result: dict) -> dict:
+        """Validate and clamp scores to the 1–9 band range (in place)."""
+        for key in _CRITERIA_KEYS:
+            criterion = result.get(key)
+            if criterion is not None:
+                criterion["score"] = max(1.0, min(9.0, float(criterion.get("score", 5.0))))
+
+        if "overall_band" in result:
+            result["overall_band"] = max(1.0, min(9.0, float(result["overall_band"])))
+
+        return result
 
     def _empty_result(self) -> dict:
-        """Return empty/default result."""
-        return {
-            "fluency_coherence": {"score": 0, "feedback": "Not enough speech to evaluate"},
-            "lexical_resource": {"score": 0, "feedback": "Not enough speech to evaluate"},
-            "grammatical_range": {"score": 0, "feedback": "Not enough speech to evaluate"},
-            "pronunciation": {"score": 0, "feedback": "Cannot evaluate from text alone"},
-            "overall_band": 0,
-            "strengths": [],
-            "improvements": ["Try speaking more to get a proper evaluation"],
-        }
-
-    def get_band_description(self, band: float) -> str:
+        """Return empty/default result (shared — callers must not mutate it)."""
+        return _EMPTY_RESULT
+
+    @staticmethod
+    def get_band_description(band: float) -> str:
         """Get a human-readable description for a band score."""
-        descriptions = {
-            9: "Expert — Full operational command of English",
-            8: "Very Good — Fully operational with occasional inaccuracies",
-            7: "Good — Operational command with occasional inaccuracies",
-            6: "Competent — Generally effective command despite some inaccuracies",
-            5: "Modest — Partial command, coping with overall meaning",
-            4: "Limited — Basic competence in familiar situations",
-            3: "Extremely Limited — Conveys only general meaning",
-            2: "Intermittent — Great difficulty understanding",
-            1: "Non-User — No ability to use language",
-        }
-        rounded = round(band)
-        return descriptions.get(rounded, f"Band {band:.1f}")
+        index = round(band) - 1
+        if 0 <= index < len(_BAND_DESCRIPTIONS):
+            return _BAND_DESCRIPTIONS[index]
+        return f"Band {band:.1f}"
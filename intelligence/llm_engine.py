@@ -217,6 +217,7 @@ class OllamaProvider(LLMProvider):
                 "model": self.model,
                 "messages": messages,
                 "stream": False,
+                "keep_alive": config.OLLAMA_KEEP_ALIVE,
                 "options": {
                     "temperature": temperature,
                     "num_predict": max_tokens,
@@ -248,6 +249,7 @@ class OllamaProvider(LLMProvider):
                 "model": self.model,
                 "prompt": classification_prompt,
                 "stream": False,
+                "keep_alive": config.OLLAMA_KEEP_ALIVE,
                 "options": {"temperature": 0.1},
             },
             timeout=config.LLM_TIMEOUT,
@@ -136,15 +136,7 @@ Keep the merged response conversational and concise (2-4 sentences).
 # IELTS BAND SCORE EVALUATION
 # ──────────────────────────────────────────────────────────────
 
-SYSTEM_BAND_SCORE = """You are an IELTS speaking examiner evaluating a student's speaking performance.
-
-STUDENT SPEECH: "{student_text}"
-SPEAKING DURATION: {duration_seconds} seconds
-CONVERSATION TOPIC: {topic}
-
-Evaluate on the 4 IELTS speaking criteria:
-
-1. FLUENCY & COHERENCE (FC):
+_BAND_DESCRIPTORS = """1. FLUENCY & COHERENCE (FC):
    - Band 9: Speaks fluently with only rare repetition. Coherent with full range of connectives.
    - Band 7: Speaks at length without noticeable effort. Uses connectives flexibly.
    - Band 5: Usually maintains flow. Limited use of connectives.
@@ -163,7 +155,17 @@ Evaluate on the 4 IELTS speaking criteria:
    - Band 9: Uses full range of pronunciation features with precision.
    - Band 7: Shows all positive features but not always consistently.
    - Band 5: Shows some effective use of features but not sustained.
+"""
+
+SYSTEM_BAND_SCORE = """You are an IELTS speaking examiner evaluating a student's speaking performance.
 
+STUDENT SPEECH: "{student_text}"
+SPEAKING DURATION: {duration_seconds} seconds
+CONVERSATION TOPIC: {topic}
+
+Evaluate on the 4 IELTS speaking criteria:
+
+""" + _BAND_DESCRIPTORS + """
 Respond with ONLY a JSON object:
 {{
     "fluency_coherence": {{"score": X.X, "feedback": "..."}},
@@ -176,6 +178,32 @@ Respond with ONLY a JSON object:
 }}
 """
 
+SYSTEM_BAND_SCORE_BATCH = """You are an IELTS speaking examiner evaluating {count} separate student speaking performances.
+
+{transcripts}
+
+Evaluate EACH transcript independently on the 4 IELTS speaking criteria:
+
+""" + _BAND_DESCRIPTORS + """
+Respond with ONLY a JSON array of exactly {count} objects, in transcript order:
+[
+    {{
+        "fluency_coherence": {{"score": X.X, "feedback": "..."}},
+        "lexical_resource": {{"score": X.X, "feedback": "..."}},
+        "grammatical_range": {{"score": X.X, "feedback": "..."}},
+        "pronunciation": {{"score": X.X, "feedback": "..."}},
+        "overall_band": X.X,
+        "strengths": ["...", "..."],
+        "improvements": ["...", "..."]
+    }}
+]
+"""
+
+BAND_SCORE_BATCH_ITEM = """TRANSCRIPT {index}:
+STUDENT SPEECH: "{student_text}"
+SPEAKING DURATION: {duration_seconds} seconds
+CONVERSATION TOPIC: {topic}"""
+
 # ──────────────────────────────────────────────────────────────
 # IELTS SPEAKING PART PROMPTS
 # ──────────────────────────────────────────────────────────────
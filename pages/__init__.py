@@ -78,9 +78,8 @@ def render_conversation_page():
             if audio:
                 with st.spinner("🧠 Processing your speech..."):
                     # Load audio models if needed
-                    from audio.stt import SpeechToText
-                    if "stt" not in st.session_state:
-                         st.session_state.stt = SpeechToText()
+                    from engine.resources import get_stt
+                    stt = get_stt()
                          
                     # The recorder returns a dict: {'bytes': b'...', 'sample_rate': 48000}
                     # Convert raw bytes to the expected format for STT
@@ -88,7 +87,7 @@ def render_conversation_page():
                     import numpy as np
                     
                     # For whisper, it's easier to let it decode the wav bytes directly
-                    # Our STT model might need numpy arrays, let's let st.session_state.stt.transcribe handle the raw bytes or convert 
+                    # Our STT model might need numpy arrays, let's let stt.transcribe handle the raw bytes or convert 
                     
                     # Write to temporary file for Whisper to process
                     import tempfile
@@ -99,7 +98,7 @@ def render_conversation_page():
                         f.write(audio_bytes)
                         
                     try:
-                        result = st.session_state.stt.transcribe(tmp_path)
+                        result = stt.transcribe(tmp_path)
                         user_text = result["text"].strip()
                         if user_text:
                             _handle_user_input(user_text)
@@ -166,7 +165,7 @@ def _handle_user_input(user_text: str):
                 vocab_status=vocab_status,
             )
 
-            context = st.session_state.memory.get_context_with_vocab()
+            context = st.session_state.memory.get_prompt_messages()
 
             with st.spinner("🧠 Thinking..."):
                 ai_response = llm.generate(
@@ -185,10 +184,8 @@ def _handle_user_input(user_text: str):
             # Generate audio
             audio_bytes = None
             try:
-                if "tts" not in st.session_state:
-                    from audio.tts import TextToSpeech
-                    st.session_state.tts = TextToSpeech()
-                audio_bytes = st.session_state.tts.synthesize_to_wav_bytes(ai_response)
+                from engine.resources import get_tts
+                audio_bytes = get_tts().synthesize_to_wav_bytes(ai_response)
                 st.session_state.conversation_history[-1]["audio_bytes"] = audio_bytes
                 st.session_state.conversation_history[-1]["autoplay"] = True
             except Exception as e:
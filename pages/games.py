@@ -62,12 +62,12 @@ def _render_word_matching():
 
         for q in questions:
             selected = st.selectbox(
-                f"**{q['word']}** means:",
-                options=["-- Select --"] + q["options"],
-                key=f"wm_{q['word']}",
+                f"**{q.word}** means:",
+                options=["-- Select --", *q.options],
+                key=f"wm_{q.word}",
             )
             if selected != "-- Select --":
-                answers[q["word"]] = selected
+                answers[q.word] = selected
 
         if st.button("✅ Check Answers", key="wm_check"):
             st.session_state.wm_answers = answers
@@ -109,11 +109,11 @@ def _render_sentence_completion():
         answers = []
 
         for i, q in enumerate(questions):
-            st.markdown(f"**{i+1}.** {q['sentence']}")
-            st.caption(f"Hint: {q['hint']}")
+            st.markdown(f"**{i+1}.** {q.sentence}")
+            st.caption(f"Hint: {q.hint}")
             answer = st.selectbox(
                 f"Word for blank {i+1}:",
-                options=["-- Select --"] + q["options"],
+                options=["-- Select --", *q.options],
                 key=f"sc_{i}",
             )
             answers.append(answer if answer != "-- Select --" else "")
@@ -197,8 +197,8 @@ def _render_error_correction():
 
         for i, q in enumerate(questions):
             st.markdown(f"**{i+1}.** Fix this sentence:")
-            st.error(f"❌ {q['sentence']}")
-            st.caption(q["hint"])
+            st.error(f"❌ {q.sentence}")
+            st.caption(q.hint)
             correction = st.text_input(
                 f"Corrected sentence {i+1}:",
                 key=f"ec_{i}",
@@ -150,9 +150,8 @@ def _render_speaking_practice():
 
 @st.cache_data(show_spinner="Synthesizing audio...")
 def _generate_audio(text: str) -> tuple[bytes, str]:
-    from audio.tts import TextToSpeech
-    tts = TextToSpeech()
-    return tts.synthesize_to_playable_bytes(text)
+    from engine.resources import get_tts
+    return get_tts().synthesize_to_playable_bytes(text)
 
 
 def _render_listening_practice():
@@ -316,9 +315,8 @@ def _render_voice_and_text_input(label: str, key: str, height: int = 80, placeho
         if audio and st.session_state.get(f"{key}_last_audio_id") != audio.get("id"):
             st.session_state[f"{key}_last_audio_id"] = audio.get("id")
             with st.spinner("🧠 Transcribing..."):
-                from audio.stt import SpeechToText
-                if "stt" not in st.session_state:
-                     st.session_state.stt = SpeechToText()
+                from engine.resources import get_stt
+                stt = get_stt()
                 
                 import tempfile
                 import os
@@ -327,7 +325,7 @@ def _render_voice_and_text_input(label: str, key: str, height: int = 80, placeho
                     f.write(audio['bytes'])
                     
                 try:
-                    result = st.session_state.stt.transcribe(tmp_path)
+                    result = stt.transcribe(tmp_path)
                     new_text = result["text"].strip()
                     if new_text:
                         current_text = st.session_state.get(key, "")
@@ -2,13 +2,10 @@
 Progress Dashboard Page — Track learning progress over time.
 """
 
-import sqlite3
 from datetime import date, timedelta
 
 import streamlit as st
 
-import config
-
 
 def render_progress_page():
     """Render the progress tracking dashboard."""
@@ -113,31 +110,7 @@ def render_progress_page():
 def _get_progress_data() -> list[dict]:
     """Get daily progress data from database."""
     try:
-        username = st.session_state.get("username", "default")
-        db_path = str(config.get_db_path(username))
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT date, total_speaking_time_sec, total_turns,
-                      words_practiced, estimated_band_score, games_played
-               FROM daily_progress
-               ORDER BY date DESC
-               LIMIT 30"""
-        )
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [
-            {
-                "date": row[0],
-                "total_speaking_time_sec": row[1] or 0,
-                "total_turns": row[2] or 0,
-                "words_practiced": row[3] or 0,
-                "estimated_band_score": row[4],
-                "games_played": row[5] or 0,
-            }
-            for row in rows
-        ]
+        return st.session_state.memory.get_daily_progress(limit=30)
     except Exception:
         return []
 
@@ -8,10 +8,9 @@ from audio.tts import TextToSpeech
 
 
 def _get_tts() -> TextToSpeech:
-    """Get or create a shared TTS instance for pronunciation."""
-    if "tts" not in st.session_state:
-        st.session_state.tts = TextToSpeech()
-    return st.session_state.tts
+    """Get the process-wide shared TTS instance for pronunciation."""
+    from engine.resources import get_tts
+    return get_tts()
 
 
 def _pronounce(text: str) -> tuple[bytes, str]:
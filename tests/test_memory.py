@@ -0,0 +1,45 @@
+"""Tests for ConversationMemory persistence."""
+
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestShutdownFlush(unittest.TestCase):
+    """Batched writes must reach the database on a normal exit without flush()."""
+
+    def test_exit_without_flush_keeps_turns_and_daily_progress(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "progress.db"
+            script = textwrap.dedent(f"""
+                from engine.memory import ConversationMemory
+
+                memory = ConversationMemory(db_path={str(db_path)!r})
+                for i in range(3):
+                    memory.add_turn("user", f"turn {{i}}")
+                memory.update_daily_progress(speaking_time_sec=12.5, add_turn=False)
+            """)
+            subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, check=True)
+
+            conn = sqlite3.connect(db_path)
+            try:
+                turns = conn.execute("SELECT COUNT(*) FROM conversation_history").fetchone()[0]
+                daily = conn.execute(
+                    "SELECT total_speaking_time_sec FROM daily_progress"
+                ).fetchall()
+            finally:
+                conn.close()
+
+        self.assertEqual(turns, 3)
+        self.assertEqual(len(daily), 1)
+        self.assertAlmostEqual(daily[0][0], 12.5)
+
+
+if __name__ == "__main__":
+    unittest.main()